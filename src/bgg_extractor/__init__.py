@@ -3,6 +3,7 @@
 A Python library for extracting, transforming, and persisting data from BoardGameGeek XML API2.
 """
 
+from bgg_extractor.cache import ResponseCache
 from bgg_extractor.client import (
     BGGClient,
     get_collection,
@@ -11,12 +12,14 @@ from bgg_extractor.client import (
     get_things,
     get_user,
     search,
+    set_default_cache,
 )
 from bgg_extractor.persistence import save_csv, save_json
 from bgg_extractor.transform import model_to_dict, models_to_list
 
 __all__ = [
     "BGGClient",
+    "ResponseCache",
     "get_collection",
     "get_family",
     "get_plays",
@@ -27,4 +30,5 @@ __all__ = [
     "save_csv",
     "save_json",
     "search",
+    "set_default_cache",
 ]
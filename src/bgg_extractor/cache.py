@@ -0,0 +1,114 @@
+"""On-disk cache for raw BGG XML responses.
+
+Responses are stored as files keyed by a hash of the endpoint path and its sorted query
+parameters, so repeated extractions of the same resources skip the network and throttle.
+"""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, ClassVar
+from urllib.parse import urlencode
+
+
+class ResponseCache:
+    """File-based cache for raw XML responses with per-endpoint expiry.
+
+    Attributes:
+        DEFAULT_DIR: Default cache directory.
+        DEFAULT_TTLS: Default time-to-live in seconds per endpoint path.
+        FALLBACK_TTL: Time-to-live for endpoints not listed in DEFAULT_TTLS.
+    """
+
+    DEFAULT_DIR: str = "~/.cache/bgg_extractor"
+    DEFAULT_TTLS: ClassVar[dict[str, int]] = {
+        "thing": 86400,
+        "family": 86400,
+        "collection": 300,
+        "plays": 300,
+        "search": 300,
+        "user": 300,
+    }
+    FALLBACK_TTL: int = 300
+
+    def __init__(self, path: str | Path = DEFAULT_DIR, ttl: int | None = None):
+        """Initialize the ResponseCache.
+
+        Args:
+            path: Directory where cached responses are stored. Created if missing.
+            ttl: Optional time-to-live in seconds applied to all endpoints,
+                overriding DEFAULT_TTLS.
+        """
+        self.base = Path(path).expanduser()
+        self.base.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    def _file(self, path: str, params: dict[str, Any]) -> Path:
+        """Return the cache file for a request.
+
+        Args:
+            path: API endpoint path (e.g., 'thing').
+            params: Query parameters.
+
+        Returns:
+            Path of the cache file for this request.
+        """
+        query = urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+        digest = hashlib.sha256(f"{path.strip('/')}?{query}".encode()).hexdigest()
+        return self.base / f"{digest}.xml"
+
+    def _ttl_for(self, path: str) -> int:
+        """Return the time-to-live in seconds for an endpoint path."""
+        if self.ttl is not None:
+            return self.ttl
+        return self.DEFAULT_TTLS.get(path.strip("/"), self.FALLBACK_TTL)
+
+    def _fresh_file(self, path: str, params: dict[str, Any]) -> Path | None:
+        """Return the cache file for a request if it exists and has not expired."""
+        f = self._file(path, params)
+        try:
+            age = time.time() - f.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if age > self._ttl_for(path):
+            return None
+        return f
+
+    def get(self, path: str, params: dict[str, Any]) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            path: API endpoint path (e.g., 'thing').
+            params: Query parameters.
+
+        Returns:
+            The cached XML string, or None if missing or expired.
+        """
+        f = self._fresh_file(path, params)
+        return f.read_text(encoding="utf-8") if f is not None else None
+
+    def get_bytes(self, path: str, params: dict[str, Any]) -> bytes | None:
+        """Look up a cached response as raw bytes, skipping the UTF-8 decode.
+
+        Args:
+            path: API endpoint path (e.g., 'thing').
+            params: Query parameters.
+
+        Returns:
+            The cached XML bytes, or None if missing or expired.
+        """
+        f = self._fresh_file(path, params)
+        return f.read_bytes() if f is not None else None
+
+    def set(self, path: str, params: dict[str, Any], xml: str | bytes) -> None:
+        """Store a response atomically.
+
+        Args:
+            path: API endpoint path (e.g., 'thing').
+            params: Query parameters.
+            xml: The raw XML response, as text or as the response body bytes (stored as-is).
+        """
+        f = self._file(path, params)
+        tmp = f.with_suffix(f.suffix + ".tmp")
+        tmp.write_bytes(xml.encode("utf-8") if isinstance(xml, str) else xml)
+        tmp.replace(f)
@@ -6,6 +6,9 @@ data extraction tasks using the high-level synchronous API.
 """
 
 import argparse
+import copy
+import functools
+import json
 import os
 import sys
 from typing import Any
@@ -14,6 +17,7 @@ import yaml
 from dotenv import load_dotenv
 
 from bgg_extractor import (
+    ResponseCache,
     get_collection,
     get_family,
     get_plays,
@@ -22,16 +26,35 @@ from bgg_extractor import (
     save_csv,
     save_json,
     search,
+    set_default_cache,
 )
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a config file, memoized on its path and modification time."""
+    with open(path, encoding="utf-8") as f:
+        if path.lower().endswith(".json"):
+            return json.load(f)
+        return yaml.load(f, Loader=SafeLoader)
+
+
 def load_config(path: str) -> dict[str, Any]:
-    """Load configuration from a YAML file.
+    """Load configuration from a YAML or JSON file.
+
+    YAML is parsed with PyYAML's libyaml-backed loader when available; files ending in
+    ``.json`` are read with the standard library JSON parser. Parsed files are cached
+    in-process until their modification time changes.
 
     Args:
-        path: Path to the YAML configuration file.
+        path: Path to the YAML or JSON configuration file.
 
     Returns:
         A dictionary containing the configuration.
@@ -39,10 +62,11 @@ def load_config(path: str) -> dict[str, Any]:
     Raises:
         FileNotFoundError: If the config file does not exist.
     """
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Config file not found: {path}")
-    with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+    return copy.deepcopy(_load_config_cached(path, mtime_ns))
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -52,7 +76,9 @@ def build_parser() -> argparse.ArgumentParser:
         An argparse.ArgumentParser instance.
     """
     p = argparse.ArgumentParser("bgg-extractor", description="Extract data from BoardGameGeek XML API2.")
-    p.add_argument("--config", type=str, help="YAML config file (overrides CLI defaults, but CLI args override config)")
+    p.add_argument(
+        "--config", type=str, help="YAML or JSON config file (overrides CLI defaults, but CLI args override config)"
+    )
     p.add_argument(
         "--extractor", choices=["things", "collection", "user", "plays", "search", "family"], help="What to extract"
     )
@@ -62,10 +88,25 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--user", type=str, help="Username for collection/user/plays extraction")
     p.add_argument("--out", type=str, default="output.json", help="Output filename")
     p.add_argument("--format", choices=["csv", "json"], default="json", help="Output format")
+    p.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache raw API responses under ~/.cache/bgg_extractor; cached collections, plays and searches "
+        "may be up to 5 minutes stale, things and families up to 24 hours (off by default)",
+    )
+    p.add_argument(
+        "--cache-ttl",
+        type=int,
+        help="Cache lifetime in seconds for all endpoints, with --cache (default: per-endpoint)",
+    )
 
     return p
 
 
+# Built once at import; parse_args does not mutate the parser, so main() can reuse it.
+_PARSER = build_parser()
+
+
 def run_extraction(args: argparse.Namespace, cfg: dict[str, Any]) -> None:
     """Run the extraction process based on arguments and configuration.
 
@@ -80,6 +121,8 @@ def run_extraction(args: argparse.Namespace, cfg: dict[str, Any]) -> None:
     username = args.user or cfg.get("user")
     out = args.out or cfg.get("out", "output.json")
     fmt = args.format or cfg.get("format", "json")
+    use_cache = args.cache or cfg.get("cache", False)
+    cache_ttl = args.cache_ttl if args.cache_ttl is not None else cfg.get("cache_ttl")
 
     # Token check is handled by the client, but we can fail early if needed.
     # However, the client raises ValueError, which is fine.
@@ -87,6 +130,8 @@ def run_extraction(args: argparse.Namespace, cfg: dict[str, Any]) -> None:
     data = None
 
     try:
+        set_default_cache(ResponseCache(ttl=cache_ttl) if use_cache else None)
+
         if extractor == "things":
             if not things:
                 print("Error: --things (or config 'things') required for extractor=things", file=sys.stderr)
@@ -171,8 +216,7 @@ def run_extraction(args: argparse.Namespace, cfg: dict[str, Any]) -> None:
 
 def main(argv=None) -> None:
     """Main entry point."""
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    args = _PARSER.parse_args(argv)
     cfg = {}
     if args.config:
         try:
@@ -4,35 +4,141 @@ BGG XMLAPI2 client implementation using httpx for async requests.
 """
 
 import asyncio
+import atexit
+import contextlib
+import email.utils
+import multiprocessing
 import os
-import time
-from collections.abc import Sequence
-from typing import Any
+from collections.abc import AsyncIterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from typing import Any, ClassVar, TypeVar
 
 import httpx
 from dotenv import load_dotenv
-
-from bgg_extractor.schemas import CollectionSchema, FamilySchema, PlaysSchema, SearchSchema, ThingSchema, UserSchema
+from lxml import etree
+
+from bgg_extractor.cache import ResponseCache
+from bgg_extractor.schemas import (
+    CollectionSchema,
+    FamilySchema,
+    PlayItem,
+    PlaysSchema,
+    SearchSchema,
+    ThingSchema,
+    UserSchema,
+)
+
+# A TypeVar rather than PEP 695 type parameters, which would require Python 3.12.
+_SchemaT = TypeVar("_SchemaT", CollectionSchema, FamilySchema, PlaysSchema, SearchSchema, ThingSchema, UserSchema)
 
 load_dotenv()
 
+# Process-wide pooled HTTP client shared by ``BGGClient.default()`` (and thus the sync wrappers).
+_SHARED_CLIENT: httpx.AsyncClient | None = None
+_DEFAULT_CLIENT: "BGGClient | None" = None
+_DEFAULT_CACHE: ResponseCache | None = None
+# Event loop reused by ``run_sync`` so the shared client's connections stay bound to one loop.
+_LOOP: asyncio.AbstractEventLoop | None = None
+# Worker processes for clients created with ``parse_processes=True``, created on first use.
+_PARSE_POOL: ProcessPoolExecutor | None = None
+# Responses shorter than this are parsed inline; below it, a hand-off costs more than the parse.
+_POOL_MIN_CHARS = 64 * 1024
+
+# Boolean query flags per endpoint, in the order of the corresponding method arguments.
+# Enabled flags are sent as ``name=1``.
+_USER_FLAGS = ("buddies", "guilds", "hot", "top")
+_COLLECTION_FLAGS = ("version", "stats", "brief", "showprivate")
+_COLLECTION_FILTERS = ("minrating", "rating", "minbggrating", "bggrating", "minplays", "maxplays", "collectionid")
+_THING_FLAGS = ("versions", "videos", "stats", "historical", "marketplace", "comments", "ratingcomments")
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    """Return the shared parse worker pool, creating it on first use.
+
+    Workers are spawned rather than forked so they never inherit the running event loop.
+    """
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+    return _PARSE_POOL
+
+
+async def _parse(schema: type[_SchemaT], xml: str | bytes, processes: bool = False) -> _SchemaT:  # noqa: UP047
+    """Parse an XML response without blocking the event loop on large payloads.
+
+    Responses of at least ``_POOL_MIN_CHARS`` are parsed in a worker thread, or in a worker
+    process when ``processes`` is set. Smaller ones are parsed inline.
+
+    Args:
+        schema: Schema class whose ``parse_xml`` is used.
+        xml: The raw XML response, as text or bytes.
+        processes: Whether to parse large responses in the shared process pool.
+
+    Returns:
+        The parsed schema.
+    """
+    if len(xml) < _POOL_MIN_CHARS:
+        return schema.parse_xml(xml)
+    if processes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_parse_pool(), schema.parse_xml, xml)
+    return await asyncio.to_thread(schema.parse_xml, xml)
+
+
+def _new_http_client(timeout: float) -> httpx.AsyncClient:
+    """Create an httpx.AsyncClient with keep-alive connection pooling and HTTP/2 multiplexing.
+
+    The default ``Accept-Encoding`` header is left to httpx, which advertises brotli and
+    zstd in addition to gzip when the ``httpx[brotli,zstd]`` extras are installed.
+
+    Args:
+        timeout: Request timeout in seconds.
+
+    Returns:
+        A configured httpx.AsyncClient.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        headers={"User-Agent": "BGG-Extractor/1.0.0"},
+    )
+
 
 class BGGClient:
     """Async BGG XMLAPI2 client.
 
-    Handles throttling, retries for 202 responses, and authentication.
+    Handles throttling, retries for 202 responses and transient failures, and authentication.
 
     Attributes:
         BASE_URL: Default base URL for BGG XMLAPI2.
         DEFAULT_WAIT_SECONDS: Default minimum delay between requests.
         DEFAULT_TIMEOUT: Default request timeout in seconds.
         DEFAULT_MAX_POLL: Default maximum number of poll attempts for 202 responses.
+        DEFAULT_MAX_CONCURRENCY: Default maximum number of requests in flight at once.
+        MAX_THING_IDS: Maximum number of IDs BGG accepts in a single 'thing' request.
+        PLAYS_PAGE_SIZE: Number of plays BGG returns per full 'plays' page.
+        MAX_RETRIES: Maximum number of retries after a transient failure.
+        RETRY_STATUSES: HTTP status codes treated as transient failures.
+        RETRY_EXCEPTIONS: Network errors treated as transient failures.
     """
 
     BASE_URL: str = "https://api.geekdo.com/xmlapi2"
     DEFAULT_WAIT_SECONDS: float = 2.0
     DEFAULT_TIMEOUT: int = 30
     DEFAULT_MAX_POLL: int = 12
+    DEFAULT_MAX_CONCURRENCY: int = 5
+    MAX_THING_IDS: int = 20
+    PLAYS_PAGE_SIZE: int = 100
+    MAX_RETRIES: int = 4
+    RETRY_STATUSES: ClassVar[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
+    RETRY_EXCEPTIONS: ClassVar[tuple[type[Exception], ...]] = (
+        httpx.ConnectError,
+        httpx.TimeoutException,
+        httpx.RemoteProtocolError,
+    )
 
     def __init__(
         self,
@@ -41,6 +147,9 @@ class BGGClient:
         timeout: int = DEFAULT_TIMEOUT,
         max_poll_attempts: int = DEFAULT_MAX_POLL,
         token: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: ResponseCache | None = None,
+        parse_processes: bool = False,
     ):
         """Initialize the BGGClient.
 
@@ -50,105 +159,224 @@ class BGGClient:
             timeout: Request timeout in seconds.
             max_poll_attempts: Max attempts to poll when receiving a 202 response.
             token: Optional BGG API token (Bearer). If not provided, checks BGG_API_TOKEN env var.
+            max_concurrency: Maximum number of requests in flight at once. Request starts are still
+                spaced by ``min_delay``, but slow responses no longer hold up the next request.
+            cache: Optional ResponseCache. Cached responses are returned without a network request.
+            parse_processes: Parse large responses in a pool of spawned worker processes instead of
+                a thread. The workers re-import ``__main__``, so scripts enabling this need an
+                ``if __name__ == "__main__":`` guard.
         """
         self.base_url = base_url.rstrip("/")
         self.min_delay = float(min_delay)
         self.timeout = int(timeout)
         self.max_poll_attempts = int(max_poll_attempts)
+        self.cache = cache
+        self.parse_processes = parse_processes
         self.token = token or os.getenv("BGG_API_TOKEN")
         if not self.token:
             raise ValueError("BGG_API_TOKEN is required. Please set it in your environment or pass it to the client.")
 
-        self._last_request_ts = 0.0
-        self._lock = asyncio.Lock()
-
-        # We'll use a single client for the session, but it should be managed carefully.
-        # For simplicity in this design, we'll create a client per request or manage a lifecycle.
-        # Ideally, the user should use a context manager, but we'll keep it simple for now
-        # and instantiate a client internally or allow passing one.
-        # To support "fast extraction", we'll use an internal client that persists if possible,
-        # or just use `httpx.AsyncClient` context in methods.
-        # Given the usage pattern, let's use a persistent client if used as a context manager,
-        # otherwise create one-off.
+        self._headers = {"Authorization": f"Bearer {self.token}"}
+        self._next_allowed = 0.0  # Event-loop (monotonic) time at which the next request may start.
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Pooled HTTP client, created by the context manager or lazily on first request.
         self._client: httpx.AsyncClient | None = None
 
+    @classmethod
+    def default(cls) -> "BGGClient":
+        """Return the process-wide client used by the synchronous wrappers.
+
+        The returned client is bound to a shared, lazily-created ``httpx.AsyncClient`` so that
+        consecutive calls reuse keep-alive connections instead of re-negotiating TCP/TLS each time.
+        A new instance is created if ``BGG_API_TOKEN`` changes.
+
+        Returns:
+            The shared BGGClient instance.
+
+        Raises:
+            ValueError: If BGG_API_TOKEN is not set.
+        """
+        global _DEFAULT_CLIENT, _SHARED_CLIENT
+        token = os.getenv("BGG_API_TOKEN")
+        if _DEFAULT_CLIENT is None or _DEFAULT_CLIENT.token != token:
+            _DEFAULT_CLIENT = cls(token=token)
+        if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+            _SHARED_CLIENT = _new_http_client(cls.DEFAULT_TIMEOUT)
+        _DEFAULT_CLIENT._client = _SHARED_CLIENT
+        _DEFAULT_CLIENT.cache = _DEFAULT_CACHE
+        return _DEFAULT_CLIENT
+
     async def __aenter__(self) -> "BGGClient":
         """Enter async context manager."""
-        self._client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
-        if self.token:
-            self._client.headers.update({"Authorization": f"Bearer {self.token}"})
+        self._client = _new_http_client(self.timeout)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit async context manager."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
         if self._client:
             await self._client.aclose()
             self._client = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create an httpx.AsyncClient."""
-        if self._client:
-            return self._client
-        # If not in context manager, create a temporary one (not ideal for connection pooling but safe)
-        # For better performance, users should use `async with BGGClient() ...`
-        client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
-        client.headers.update({"User-Agent": "BGG-Extractor/1.0.0"})
-        if self.token:
-            client.headers.update({"Authorization": f"Bearer {self.token}"})
-        return client
+        """Get the pooled httpx.AsyncClient, creating it on first use.
+
+        Clients used outside ``async with`` keep their connection pool between requests;
+        call ``aclose()`` when done with them.
+        """
+        if self._client is None:
+            self._client = _new_http_client(self.timeout)
+        return self._client
 
     async def _throttle(self) -> None:
         """Enforce minimum delay between requests."""
-        async with self._lock:
-            elapsed = time.time() - self._last_request_ts
-            if elapsed < self.min_delay:
-                await asyncio.sleep(self.min_delay - elapsed)
-            self._last_request_ts = time.time()
+        # Reserve the next start slot before awaiting. There is no await between reading and
+        # writing _next_allowed, so concurrent callers each get a distinct slot without a lock.
+        now = asyncio.get_running_loop().time()
+        start = max(self._next_allowed, now)
+        self._next_allowed = start + self.min_delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def _retry_delay(self, resp: httpx.Response | None, attempts: int) -> float:
+        """Compute how long to wait before polling a queued (202) request again or retrying a failed one.
 
-    async def _request_xml(self, path: str, params: dict[str, Any]) -> str:
-        """Make an async GET request, handling throttling and 202 retries.
+        Honors a ``Retry-After`` header given in seconds or as an HTTP date. Without one, falls back to
+        exponential backoff: min_delay * (1.5 ^ attempts), e.g. 2.0, 3.0, 4.5, 6.75...
+
+        Args:
+            resp: The 202 or failed response, or None after a network error.
+            attempts: Number of 202 responses (or failures) received so far for this request.
+
+        Returns:
+            Delay in seconds, capped at ``min_delay * 60``.
+        """
+        delay = self.min_delay * (1.5 ** (attempts - 1))
+        retry_after = resp.headers.get("Retry-After") if resp is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                with contextlib.suppress(TypeError, ValueError):
+                    when = email.utils.parsedate_to_datetime(retry_after)
+                    delay = (when - datetime.now(UTC)).total_seconds()
+        return min(max(delay, 0.0), self.min_delay * 60)
+
+    async def _send(self, path: str, params: dict[str, Any], stream: bool = False) -> httpx.Response:
+        """Send a GET request, handling throttling, 202 polling and transient-failure retries.
 
         Args:
             path: API endpoint path (e.g., 'thing').
             params: Query parameters.
+            stream: If True, return the response before its body is read. The caller must close it.
 
         Returns:
-            The raw XML response string.
+            The successful (200) response.
 
         Raises:
             RuntimeError: If the API returns an error or times out polling.
+            httpx.TransportError: If a network error persists after ``MAX_RETRIES`` retries.
         """
         url = f"{self.base_url}/{path.lstrip('/')}"
         attempts = 0
-
-        # If we created a temp client, we must close it.
-        # If self._client is set, we use it and don't close it.
+        failures = 0
         client = await self._get_client()
-        should_close = self._client is None
 
-        try:
-            while True:
+        while True:
+            async with self._semaphore:
                 await self._throttle()
-                resp = await client.get(url, params=params)
+                request = client.build_request("GET", url, params=params, headers=self._headers)
+                try:
+                    resp = await client.send(request, stream=stream)
+                except self.RETRY_EXCEPTIONS:
+                    if failures >= self.MAX_RETRIES:
+                        raise
+                    resp = None
+
+            if resp is None:
+                failures += 1
+                await asyncio.sleep(self._retry_delay(None, failures))
+                continue
+            if resp.status_code == 200:
+                return resp
+            if stream:
+                await resp.aread()
+
+            if resp.status_code == 202:
+                attempts += 1
+                if attempts >= self.max_poll_attempts:
+                    raise RuntimeError(f"BGG queued too long: {path} params={params}")
+
+                await asyncio.sleep(self._retry_delay(resp, attempts))
+                continue
+            if resp.status_code in self.RETRY_STATUSES and failures < self.MAX_RETRIES:
+                failures += 1
+                await asyncio.sleep(self._retry_delay(resp, failures))
+                continue
+
+            raise RuntimeError(f"BGG API returned {resp.status_code}: {resp.text}")
+
+    async def _request_xml(self, path: str, params: dict[str, Any]) -> bytes:
+        """Make an async GET request, handling caching, throttling and 202 retries.
 
-                if resp.status_code == 200:
-                    return resp.text
+        Args:
+            path: API endpoint path (e.g., 'thing').
+            params: Query parameters.
 
-                if resp.status_code == 202:
-                    attempts += 1
-                    if attempts >= self.max_poll_attempts:
-                        raise RuntimeError(f"BGG queued too long: {path} params={params}")
+        Returns:
+            The raw XML response body. Bytes are handed to the parser undecoded.
 
-                    # Exponential backoff: min_delay * (1.5 ^ attempts)
-                    # e.g., 2.0, 3.0, 4.5, 6.75...
-                    backoff = self.min_delay * (1.5 ** (attempts - 1))
-                    await asyncio.sleep(backoff)
-                    continue
+        Raises:
+            RuntimeError: If the API returns an error or times out polling.
+        """
+        if self.cache is not None:
+            cached = self.cache.get_bytes(path, params)
+            if cached is not None:
+                return cached
 
-                raise RuntimeError(f"BGG API returned {resp.status_code}: {resp.text}")
+        resp = await self._send(path, params)
+        if self.cache is not None:
+            self.cache.set(path, params, resp.content)
+        return resp.content
+
+    async def _request_xml_stream(
+        self, path: str, params: dict[str, Any], tag: str = "item"
+    ) -> AsyncIterator[etree._Element]:
+        """Make an async GET request and parse the body incrementally as it downloads.
+
+        Chunks are fed into an lxml ``XMLPullParser`` so parsing overlaps with the network transfer and the
+        raw body is never buffered as a whole. Each yielded element is detached from the tree once the
+        caller resumes, keeping memory bounded. The response cache is bypassed.
+
+        Args:
+            path: API endpoint path (e.g., 'thing').
+            params: Query parameters.
+            tag: Tag of the top-level elements to yield.
+
+        Yields:
+            Completed top-level elements with the given tag, in document order.
+
+        Raises:
+            RuntimeError: If the API returns an error or times out polling.
+        """
+        resp = await self._send(path, params, stream=True)
+        try:
+            parser = etree.XMLPullParser(events=("end",), tag=tag, resolve_entities=False, no_network=True)
+            async for chunk in resp.aiter_bytes():
+                parser.feed(chunk)
+                for _, elem in parser.read_events():
+                    parent = elem.getparent()
+                    # Only top-level elements; nested ones (e.g. thing versions) belong to their item.
+                    if parent is not None and parent.getparent() is None:
+                        yield elem
+                        parent.remove(elem)
+            parser.close()
         finally:
-            if should_close:
-                await client.aclose()
+            await resp.aclose()
 
     async def get_user(
         self,
@@ -176,22 +404,11 @@ class BGGClient:
         Returns:
             A UserSchema object.
         """
-        params = {"name": name}
-        if buddies:
-            params["buddies"] = 1
-        if guilds:
-            params["guilds"] = 1
-        if hot:
-            params["hot"] = 1
-        if top:
-            params["top"] = 1
-        if domain:
-            params["domain"] = domain
-        if page:
-            params["page"] = page
-        params.update(kwargs)
-        xml = await self._request_xml("user", params)
-        return UserSchema.parse_xml(xml)
+        params: dict[str, Any] = {"name": name}
+        params.update({flag: 1 for flag, on in zip(_USER_FLAGS, (buddies, guilds, hot, top), strict=True) if on})
+        params |= {key: value for key, value in (("domain", domain), ("page", page)) if value}
+        xml = await self._request_xml("user", params | kwargs)
+        return await _parse(UserSchema, xml, self.parse_processes)
 
     async def get_collection(
         self,
@@ -210,6 +427,7 @@ class BGGClient:
         maxplays: int | None = None,
         collectionid: int | None = None,
         modifiedsince: str | None = None,
+        stream: bool = False,
         **kwargs: Any,
     ) -> CollectionSchema:
         """Fetch a user's collection.
@@ -230,43 +448,29 @@ class BGGClient:
             maxplays: Filter by max plays.
             collectionid: Restrict to specific collection ID.
             modifiedsince: Return items modified since date (YY-MM-DD or YY-MM-DD%20HH:MM:SS).
+            stream: Parse the response incrementally while it downloads (bypasses the response cache).
             **kwargs: Additional parameters.
 
         Returns:
             A CollectionSchema object.
         """
-        params = {"username": username}
-        if version:
-            params["version"] = 1
+        params: dict[str, Any] = {"username": username}
+        flags = (version, stats, brief, showprivate)
+        params.update({flag: 1 for flag, on in zip(_COLLECTION_FLAGS, flags, strict=True) if on})
         if subtype:
             params["subtype"] = subtype
         if excludesubtype:
             params["excludesubtype"] = excludesubtype
-        if stats:
-            params["stats"] = 1
-        if brief:
-            params["brief"] = 1
-        if showprivate:
-            params["showprivate"] = 1
-        if minrating is not None:
-            params["minrating"] = minrating
-        if rating is not None:
-            params["rating"] = rating
-        if minbggrating is not None:
-            params["minbggrating"] = minbggrating
-        if bggrating is not None:
-            params["bggrating"] = bggrating
-        if minplays is not None:
-            params["minplays"] = minplays
-        if maxplays is not None:
-            params["maxplays"] = maxplays
-        if collectionid is not None:
-            params["collectionid"] = collectionid
+        filters = (minrating, rating, minbggrating, bggrating, minplays, maxplays, collectionid)
+        params.update({
+            key: value for key, value in zip(_COLLECTION_FILTERS, filters, strict=True) if value is not None
+        })
         if modifiedsince:
             params["modifiedsince"] = modifiedsince
-        params.update(kwargs)
-        xml = await self._request_xml("collection", params)
-        return CollectionSchema.parse_xml(xml)
+        if stream:
+            return await CollectionSchema.from_element_stream(self._request_xml_stream("collection", params | kwargs))
+        xml = await self._request_xml("collection", params | kwargs)
+        return await _parse(CollectionSchema, xml, self.parse_processes)
 
     async def get_thing(
         self,
@@ -281,6 +485,7 @@ class BGGClient:
         ratingcomments: bool = False,
         page: int = 1,
         pagesize: int = 100,
+        stream: bool = False,
         **kwargs: Any,
     ) -> ThingSchema:
         """Fetch details for specific things (games).
@@ -297,6 +502,7 @@ class BGGClient:
             ratingcomments: Include comments with ratings.
             page: Page number for comments.
             pagesize: Page size for comments (10-100).
+            stream: Parse the response incrementally while it downloads (bypasses the response cache).
             **kwargs: Additional parameters.
 
         Returns:
@@ -304,31 +510,44 @@ class BGGClient:
         """
         if not ids:
             raise ValueError("ids list must not be empty.")
-        params = {"id": ",".join(str(i) for i in ids)}
-
+        params: dict[str, Any] = {"id": ",".join(map(str, ids))}
         if thing_type:
             params["type"] = thing_type
-        if versions:
-            params["versions"] = 1
-        if videos:
-            params["videos"] = 1
-        if stats:
-            params["stats"] = 1
-        if historical:
-            params["historical"] = 1
-        if marketplace:
-            params["marketplace"] = 1
-        if comments:
-            params["comments"] = 1
-        if ratingcomments:
-            params["ratingcomments"] = 1
-        if page:
-            params["page"] = page
-        if pagesize:
-            params["pagesize"] = pagesize
-        params.update(kwargs)
-        xml = await self._request_xml("thing", params)
-        return ThingSchema.parse_xml(xml)
+        flags = (versions, videos, stats, historical, marketplace, comments, ratingcomments)
+        params.update({flag: 1 for flag, on in zip(_THING_FLAGS, flags, strict=True) if on})
+        params |= {key: value for key, value in (("page", page), ("pagesize", pagesize)) if value}
+        if stream:
+            return await ThingSchema.from_element_stream(self._request_xml_stream("thing", params | kwargs))
+        xml = await self._request_xml("thing", params | kwargs)
+        return await _parse(ThingSchema, xml, self.parse_processes)
+
+    async def get_things_batched(
+        self,
+        ids: Sequence[int],
+        batch_size: int = MAX_THING_IDS,
+        **kwargs: Any,
+    ) -> ThingSchema:
+        """Fetch details for any number of things, batching IDs into as few requests as possible.
+
+        Batches are requested concurrently. The client's throttle and ``max_concurrency`` still
+        pace them, but queued (202) polling and transfers of different batches overlap.
+
+        Args:
+            ids: List of BGG thing IDs.
+            batch_size: Number of IDs per request (BGG accepts at most 20).
+            **kwargs: Additional parameters passed to ``get_thing``.
+
+        Returns:
+            A ThingSchema object with the items of all batches merged in request order.
+        """
+        if not ids:
+            raise ValueError("ids list must not be empty.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        batches = await asyncio.gather(
+            *(self.get_thing(ids[start : start + batch_size], **kwargs) for start in range(0, len(ids), batch_size))
+        )
+        return ThingSchema(items=[item for batch in batches for item in batch.items])
 
     async def search(
         self,
@@ -348,14 +567,13 @@ class BGGClient:
         Returns:
             A SearchSchema object.
         """
-        params = {"query": query}
+        params: dict[str, Any] = {"query": query}
         if thing_type:
             params["type"] = thing_type
         if exact:
             params["exact"] = 1
-        params.update(kwargs)
-        xml = await self._request_xml("search", params)
-        return SearchSchema.parse_xml(xml)
+        xml = await self._request_xml("search", params | kwargs)
+        return await _parse(SearchSchema, xml, self.parse_processes)
 
     async def get_plays(
         self,
@@ -383,28 +601,56 @@ class BGGClient:
         Returns:
             A PlaysSchema object.
         """
-        params = {}
-        if username:
-            params["username"] = username
-        if thing_id:
-            params["id"] = thing_id
-        if thing_type:
-            params["type"] = thing_type
-        if mindate:
-            params["mindate"] = mindate
-        if maxdate:
-            params["maxdate"] = maxdate
-        if subtype:
-            params["subtype"] = subtype
-        if page:
-            params["page"] = page
-
+        values = (
+            ("username", username),
+            ("id", thing_id),
+            ("type", thing_type),
+            ("mindate", mindate),
+            ("maxdate", maxdate),
+            ("subtype", subtype),
+            ("page", page),
+        )
+        params: dict[str, Any] = {key: value for key, value in values if value}
         if not params.get("username") and not (params.get("id") and params.get("type")):
             raise ValueError("username OR (id and type) required for plays")
 
-        params.update(kwargs)
-        xml = await self._request_xml("plays", params)
-        return PlaysSchema.parse_xml(xml)
+        xml = await self._request_xml("plays", params | kwargs)
+        return await _parse(PlaysSchema, xml, self.parse_processes)
+
+    async def iter_plays(
+        self,
+        username: str | None = None,
+        thing_id: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[PlayItem]:
+        """Iterate over all pages of plays, prefetching the next page while yielding the current one.
+
+        Iteration stops after the first page with fewer than ``PLAYS_PAGE_SIZE`` plays.
+
+        Args:
+            username: Username to fetch plays for.
+            thing_id: ID of the item to fetch plays for.
+            **kwargs: Additional parameters passed to ``get_plays``. ``page`` sets the first page.
+
+        Yields:
+            PlayItem objects in page order.
+        """
+        page = kwargs.pop("page", 1)
+        task = asyncio.create_task(self.get_plays(username=username, thing_id=thing_id, page=page, **kwargs))
+        try:
+            while task is not None:
+                current = await task
+                task = None
+                if len(current.plays) >= self.PLAYS_PAGE_SIZE:
+                    page += 1
+                    task = asyncio.create_task(
+                        self.get_plays(username=username, thing_id=thing_id, page=page, **kwargs)
+                    )
+                for play in current.plays:
+                    yield play
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
 
     async def get_family(
         self,
@@ -424,79 +670,81 @@ class BGGClient:
         """
         if not ids:
             raise ValueError("ids list must not be empty")
-        params = {"id": ",".join(str(i) for i in ids)}
+        params: dict[str, Any] = {"id": ",".join(map(str, ids))}
         if family_type:
             params["type"] = family_type
-        params.update(kwargs)
-        xml = await self._request_xml("family", params)
-        return FamilySchema.parse_xml(xml)
+        xml = await self._request_xml("family", params | kwargs)
+        return await _parse(FamilySchema, xml, self.parse_processes)
 
 
-def run_sync(coro):
-    """Run an async coroutine synchronously."""
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, preferring uvloop when it is installed."""
     try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
 
 
-def search(query: str, **kwargs: Any) -> SearchSchema:
-    """Synchronous wrapper for search."""
+def run_sync(coro):
+    """Run an async coroutine synchronously.
 
-    async def _run():
-        async with BGGClient() as client:
-            return await client.search(query, **kwargs)
+    All calls share one event loop (uvloop when available), so the pooled connections of
+    ``BGGClient.default()`` remain usable from one call to the next.
+    """
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = _new_event_loop()
+    return _LOOP.run_until_complete(coro)
 
-    return run_sync(_run())
 
+def set_default_cache(cache: ResponseCache | None) -> None:
+    """Set the response cache used by the synchronous wrappers.
 
-def get_things(ids: list[int], **kwargs: Any) -> ThingSchema:
-    """Synchronous wrapper for get_thing."""
+    Args:
+        cache: A ResponseCache, or None to disable caching.
+    """
+    global _DEFAULT_CACHE
+    _DEFAULT_CACHE = cache
 
-    async def _run():
-        async with BGGClient() as client:
-            return await client.get_thing(ids, **kwargs)
 
-    return run_sync(_run())
+def _close_shared_client() -> None:
+    """Close the shared HTTP client at interpreter exit."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None and not _SHARED_CLIENT.is_closed:
+        with contextlib.suppress(RuntimeError):
+            run_sync(_SHARED_CLIENT.aclose())
+    _SHARED_CLIENT = None
 
 
-def get_collection(username: str, **kwargs: Any) -> CollectionSchema:
-    """Synchronous wrapper for get_collection."""
+atexit.register(_close_shared_client)
 
-    async def _run():
-        async with BGGClient() as client:
-            return await client.get_collection(username, **kwargs)
 
-    return run_sync(_run())
+def search(query: str, **kwargs: Any) -> SearchSchema:
+    """Synchronous wrapper for search."""
+    return run_sync(BGGClient.default().search(query, **kwargs))
 
 
-def get_plays(username: str | None = None, thing_id: int | None = None, **kwargs: Any) -> PlaysSchema:
-    """Synchronous wrapper for get_plays."""
+def get_things(ids: list[int], **kwargs: Any) -> ThingSchema:
+    """Synchronous wrapper for get_things_batched."""
+    return run_sync(BGGClient.default().get_things_batched(ids, **kwargs))
 
-    async def _run():
-        async with BGGClient() as client:
-            return await client.get_plays(username=username, thing_id=thing_id, **kwargs)
 
-    return run_sync(_run())
+def get_collection(username: str, **kwargs: Any) -> CollectionSchema:
+    """Synchronous wrapper for get_collection."""
+    return run_sync(BGGClient.default().get_collection(username, **kwargs))
 
 
-def get_family(ids: list[int], **kwargs: Any) -> FamilySchema:
-    """Synchronous wrapper for get_family."""
+def get_plays(username: str | None = None, thing_id: int | None = None, **kwargs: Any) -> PlaysSchema:
+    """Synchronous wrapper for get_plays."""
+    return run_sync(BGGClient.default().get_plays(username=username, thing_id=thing_id, **kwargs))
 
-    async def _run():
-        async with BGGClient() as client:
-            return await client.get_family(ids, **kwargs)
 
-    return run_sync(_run())
+def get_family(ids: list[int], **kwargs: Any) -> FamilySchema:
+    """Synchronous wrapper for get_family."""
+    return run_sync(BGGClient.default().get_family(ids, **kwargs))
 
 
 def get_user(name: str, **kwargs: Any) -> UserSchema:
     """Synchronous wrapper for get_user."""
-
-    async def _run():
-        async with BGGClient() as client:
-            return await client.get_user(name, **kwargs)
-
-    return run_sync(_run())
+    return run_sync(BGGClient.default().get_user(name, **kwargs))
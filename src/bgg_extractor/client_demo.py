@@ -8,13 +8,21 @@ Features:
 - Parses minimal fields from returned XML into Python dict/list structures
 """
 
+import email.utils
+import math
 import os
+import random
 import time
-import xml.etree.ElementTree as ET
+from pathlib import Path
 from typing import Any
 
 import requests
 from dotenv import load_dotenv
+from lxml import etree as ET
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from bgg_extractor.cache import ResponseCache
 
 load_dotenv()  # reads .env into environment
 token = os.getenv("BGG_API_TOKEN")
@@ -23,6 +31,13 @@ BASE = "https://boardgamegeek.com/xmlapi2"
 DEFAULT_WAIT_SECONDS = 5.0
 DEFAULT_TIMEOUT = 30.0
 MAX_POLL_ATTEMPTS = 12  # 12 * 5s = ~60s max wait for 202 -> 200
+POOL_MAXSIZE = 32  # keep-alive connections kept per host
+MAX_BACKOFF_SECONDS = 30.0
+MAX_THING_IDS = 20  # BGG accepts at most 20 ids per thing request
+RETRY_STATUSES = frozenset({202, 429, 503})  # queued or rate limited: wait and poll again
+
+# shared lxml parser; no entity expansion or network access, blank text and xml:id table skipped
+_XML_PARSER = ET.XMLParser(resolve_entities=False, no_network=True, remove_blank_text=True, collect_ids=False)
 
 
 class BGGClient:
@@ -33,12 +48,20 @@ class BGGClient:
         timeout: float = DEFAULT_TIMEOUT,
         max_poll_attempts: int = MAX_POLL_ATTEMPTS,
         bearer_token: str | None = None,
+        cache_path: str | Path | None = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.min_delay = float(min_delay)
         self.timeout = float(timeout)
         self.max_poll_attempts = int(max_poll_attempts)
+        # optional on-disk response cache (per-endpoint TTLs, e.g. 24h for things); hits skip throttle and network
+        self.cache = ResponseCache(cache_path) if cache_path is not None else None
         self._session = requests.Session()
+        # larger keep-alive pool than the default (10); retries are handled in _request_xml
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+        self._session.mount("https://", adapter)
+        # every encoding urllib3 can decode here: gzip/deflate, plus br and zstd when brotli/zstandard are installed
+        self._session.headers["Accept-Encoding"] = ACCEPT_ENCODING
         self._last_request_ts = 0.0
         if bearer_token:
             # official requirement: "Authorization: Bearer <token>"
@@ -50,13 +73,40 @@ class BGGClient:
             to_sleep = self.min_delay - elapsed
             time.sleep(to_sleep)
 
-    def _request_xml(self, path: str, params: dict[str, Any]) -> str:
+    def _retry_delay(self, resp: requests.Response, attempts: int) -> float:
+        """
+        Seconds to wait before polling again: the Retry-After header if present
+        (clamped to 0..MAX_BACKOFF_SECONDS), otherwise jittered exponential backoff
+        between min_delay and min(min_delay * 2^attempts, MAX_BACKOFF_SECONDS).
+        """
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None and not math.isnan(delay):
+                return min(max(delay, 0.0), MAX_BACKOFF_SECONDS)
+        upper = max(self.min_delay, min(self.min_delay * (2**attempts), MAX_BACKOFF_SECONDS))
+        return random.uniform(self.min_delay, upper)  # noqa: S311 - jitter, not cryptography
+
+    def _request_xml(self, path: str, params: dict[str, Any]) -> bytes:
         """
         GET request that:
         - respects throttle (min_delay)
-        - polls on 202 responses until 200 or until attempts exhausted
-        Returns XML text on success (200), raises RuntimeError on failure.
+        - polls on 202 (and 429/503) responses with jittered backoff until 200 or until attempts exhausted
+        - serves and stores responses through the on-disk cache when cache_path was given
+        Returns the raw XML bytes on success (200), raises RuntimeError on failure.
+        The bytes go straight to lxml, which honours the document's encoding declaration.
         """
+        if self.cache is not None:
+            cached = self.cache.get_bytes(path, params)
+            if cached is not None:
+                return cached
+
         url = f"{self.base_url}/{path.lstrip('/')}"
         attempts = 0
         while True:
@@ -68,18 +118,21 @@ class BGGClient:
                 raise RuntimeError(f"Network error while requesting {url}: {e}") from e
 
             if resp.status_code == 200:
-                return resp.text
-            elif resp.status_code == 202:
-                # queued; poll until ready
+                if self.cache is not None:
+                    self.cache.set(path, params, resp.content)
+                return resp.content
+            elif resp.status_code in RETRY_STATUSES:
+                # queued or rate limited; poll until ready
                 attempts += 1
                 if attempts >= self.max_poll_attempts:
-                    raise RuntimeError(f"BGG API still queued after {attempts} attempts (path={path}, params={params})")
-                # exponential-ish backoff but still respect min_delay
-                # sleep at least min_delay (BGG recommends ~5s between requests)
-                time.sleep(self.min_delay)
+                    raise RuntimeError(
+                        f"BGG API still returning {resp.status_code} after {attempts} attempts "
+                        f"(path={path}, params={params})"
+                    )
+                # jittered backoff (never below min_delay) so concurrent clients don't retry in lockstep
+                time.sleep(self._retry_delay(resp, attempts))
                 continue
             else:
-                # treat 500/503 as transient too, optionally allow caller to retry
                 raise RuntimeError(f"BGG API returned status {resp.status_code} for {url} with params {params}")
 
     # --- high-level API methods ---
@@ -159,6 +212,18 @@ class BGGClient:
         xml = self._request_xml("thing", params)
         return self._parse_thing(xml)
 
+    def get_things_chunked(self, ids: list[int], chunk: int = MAX_THING_IDS, **kwargs: Any) -> dict:
+        """
+        Fetch any number of things in as few requests as possible: ids are split into
+        chunks of up to `chunk` ids, one thing request per chunk, and the items merged in order.
+        """
+        if chunk < 1:
+            raise ValueError("chunk must be at least 1")
+        items = []
+        for start in range(0, len(ids), chunk):
+            items.extend(self.get_thing(ids[start : start + chunk], **kwargs)["items"])
+        return {"items": items}
+
     def search(self, query: str, type_: str | None = None, exact: bool = False) -> dict:
         params = {"query": query}
         if type_:
@@ -197,98 +262,98 @@ class BGGClient:
 
     # --- minimal XML parsing utilities (expand as you need) ---
 
-    def _parse_user(self, xml_text: str) -> dict:
-        root = ET.fromstring(xml_text)
+    def _parse_user(self, xml: bytes) -> dict:
+        root = ET.fromstring(xml, _XML_PARSER)
         # <user id="..." name="..." ...>
         usr = root.find("user")
         if usr is None:
             return {}
         out = {
-            "id": usr.attrib.get("id"),
-            "name": usr.attrib.get("name"),
-            "firstname": usr.attrib.get("firstname"),
-            "lastname": usr.attrib.get("lastname"),
-            "avatar": usr.attrib.get("avatar"),
-            "registered": usr.attrib.get("registered"),
+            "id": usr.get("id"),
+            "name": usr.get("name"),
+            "firstname": usr.get("firstname"),
+            "lastname": usr.get("lastname"),
+            "avatar": usr.get("avatar"),
+            "registered": usr.get("registered"),
         }
         # optionally extract top/hot lists
         hot = usr.find("hot")
         if hot is not None:
-            out["hot"] = [item.attrib for item in hot.findall("item")]
+            out["hot"] = [dict(item.attrib) for item in hot.findall("item")]
         top = usr.find("top")
         if top is not None:
-            out["top"] = [item.attrib for item in top.findall("item")]
+            out["top"] = [dict(item.attrib) for item in top.findall("item")]
         return out
 
-    def _parse_collection(self, xml_text: str) -> dict:
-        root = ET.fromstring(xml_text)
+    def _parse_collection(self, xml: bytes) -> dict:
+        root = ET.fromstring(xml, _XML_PARSER)
         collection = {"items": []}
         for item in root.findall("item"):
             it = {
-                "objectid": item.attrib.get("objectid"),
-                "subtype": item.attrib.get("subtype"),
-                "collid": item.attrib.get("collid"),
+                "objectid": item.get("objectid"),
+                "subtype": item.get("subtype"),
+                "collid": item.get("collid"),
             }
             name_node = item.find("name")
             if name_node is not None:
-                it["name"] = name_node.attrib.get("value")
+                it["name"] = name_node.get("value")
             stats = item.find("stats")
             if stats is not None:
-                it["rating"] = stats.attrib.get("rating")
+                it["rating"] = stats.get("rating")
             collection["items"].append(it)
         return collection
 
-    def _parse_thing(self, xml_text: str) -> dict:
-        root = ET.fromstring(xml_text)
+    def _parse_thing(self, xml: bytes) -> dict:
+        root = ET.fromstring(xml, _XML_PARSER)
         things = []
         for item in root.findall("item"):
             t = {
-                "id": item.attrib.get("id"),
-                "type": item.attrib.get("type"),
+                "id": item.get("id"),
+                "type": item.get("type"),
             }
             name = item.find("name")
             if name is not None:
-                t["name"] = name.attrib.get("value")
+                t["name"] = name.get("value")
             year = item.find("yearpublished")
             if year is not None:
-                t["yearpublished"] = year.attrib.get("value")
+                t["yearpublished"] = year.get("value")
             stats = item.find("statistics")
             if stats is not None:
                 ratings = stats.find("ratings")
                 if ratings is not None:
                     try:
-                        t["usersrated"] = ratings.attrib.get("usersrated")
-                        t["average"] = ratings.attrib.get("average")
+                        t["usersrated"] = ratings.get("usersrated")
+                        t["average"] = ratings.get("average")
                     except Exception:  # noqa: S110 - Expected failure for non-date values
                         pass
             things.append(t)
         return {"items": things}
 
-    def _parse_search(self, xml_text: str) -> dict:
-        root = ET.fromstring(xml_text)
+    def _parse_search(self, xml: bytes) -> dict:
+        root = ET.fromstring(xml, _XML_PARSER)
         items = []
         for item in root.findall("item"):
             name_elem = item.find("name")
             items.append({
-                "id": item.attrib.get("id"),
-                "type": item.attrib.get("type"),
-                "name": name_elem.attrib.get("value") if name_elem is not None else None,
+                "id": item.get("id"),
+                "type": item.get("type"),
+                "name": name_elem.get("value") if name_elem is not None else None,
             })
         return {"items": items}
 
-    def _parse_plays(self, xml_text: str) -> dict:
-        root = ET.fromstring(xml_text)
+    def _parse_plays(self, xml: bytes) -> dict:
+        root = ET.fromstring(xml, _XML_PARSER)
         plays = []
         for play in root.findall("play"):
             p = {
-                "id": play.attrib.get("id"),
-                "date": play.attrib.get("date"),
-                "quantity": play.attrib.get("quantity"),
-                "length": play.attrib.get("length"),
+                "id": play.get("id"),
+                "date": play.get("date"),
+                "quantity": play.get("quantity"),
+                "length": play.get("length"),
             }
             item = play.find("item")
             if item is not None:
-                p["item"] = item.attrib
+                p["item"] = dict(item.attrib)
             plays.append(p)
         return {"plays": plays}
 
@@ -4,11 +4,15 @@ This module defines the data models for various BGG API entities (Thing, User, C
 and provides XML parsing logic to convert raw API responses into typed Pydantic objects.
 """
 
-import xml.etree.ElementTree as ET
-from collections.abc import Callable
-from typing import Any, Literal, cast
+import os
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterator
+from io import BytesIO
+from typing import Any, BinaryIO, ClassVar, Literal, Self, cast, get_args
+from urllib.parse import urlencode
 
-from pydantic import BaseModel, field_validator
+from lxml import etree as ET
+from pydantic import BaseModel, ConfigDict, field_validator
 
 ThingType = Literal[
     "boardgame",
@@ -18,6 +22,162 @@ ThingType = Literal[
     "rpgitem",
     "rpgissue",
 ]
+_VALID_THING_TYPES: frozenset[str] = frozenset(get_args(ThingType))
+
+# Shared lxml parser. Entity expansion and network access stay disabled for API responses;
+# whitespace-only text nodes and the xml:id table are skipped since nothing reads them.
+_XML_PARSER = ET.XMLParser(resolve_entities=False, no_network=True, remove_blank_text=True, collect_ids=False)
+# Nested lookups compiled once; lxml runs compiled XPath in C, while find() goes through
+# the Python-level ElementPath layer on every call.
+_RATINGS_XPATH = ET.XPath("ratings")
+# Main boardgame rank (id=1), relative to <ratings>.
+_MAIN_RANK_XPATH = ET.XPath("ranks/rank[@id='1']")
+_RATING_XPATH = ET.XPath("rating")
+_PLAYER_XPATH = ET.XPath("player")
+
+
+def _as_bytes(xml_text: str | bytes) -> bytes:
+    """Return the XML document as bytes for lxml.
+
+    Raw response bytes are passed through untouched. Text is encoded because lxml rejects
+    ``str`` input carrying an encoding declaration, which BGG responses always include.
+    """
+    return xml_text.encode("utf-8") if isinstance(xml_text, str) else xml_text
+
+
+def _fromstring(xml_text: str | bytes) -> ET._Element:
+    """Parse an XML document with lxml.
+
+    Args:
+        xml_text: The raw XML document, as text or bytes.
+
+    Returns:
+        The root element.
+    """
+    return ET.fromstring(_as_bytes(xml_text), _XML_PARSER)
+
+
+def _iter_children(xml_text: str | bytes | BinaryIO, tag: str) -> Iterator[ET._Element]:
+    """Incrementally parse an XML document, yielding the root's ``tag`` children one at a time.
+
+    Each element is cleared and detached once the caller resumes, so peak memory stays
+    bounded by a single child rather than the whole tree. Nested elements with the same
+    tag (e.g. version ``<item>`` elements inside a thing) are left to their parent.
+
+    Args:
+        xml_text: The raw XML document, as text or bytes, or a binary file object
+            (read incrementally).
+        tag: Tag name of the root's children to yield.
+
+    Yields:
+        Fully parsed top-level ``tag`` elements.
+    """
+    source = xml_text if hasattr(xml_text, "read") else BytesIO(_as_bytes(xml_text))
+    return _iter_source_children(source, tag)
+
+
+def _iter_source_children(source: str | BinaryIO, tag: str) -> Iterator[ET._Element]:
+    """``_iter_children`` for a file path or binary file object handed straight to lxml.
+
+    Args:
+        source: Filename (read by libxml2 directly) or binary file object.
+        tag: Tag name of the root's children to yield.
+
+    Yields:
+        Fully parsed top-level ``tag`` elements.
+    """
+    events = ET.iterparse(
+        source,
+        events=("end",),
+        tag=tag,
+        resolve_entities=False,
+        no_network=True,
+        remove_blank_text=True,
+        collect_ids=False,
+    )
+    for _, elem in events:
+        parent = elem.getparent()
+        if parent is None or parent.getparent() is not None:
+            continue
+        yield elem
+        elem.clear()
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def _first_children(elem: ET._Element) -> dict[str, ET._Element]:
+    """Map each child tag to its first element in one pass, instead of one ``find`` scan per field.
+
+    Args:
+        elem: The parent element.
+
+    Returns:
+        Dict of tag to first child element with that tag.
+    """
+    children: dict[str, ET._Element] = {}
+    for child in elem:
+        children.setdefault(child.tag, child)
+    return children
+
+
+def _node_val(node: ET._Element | None, convert: Callable[[str], Any] = str) -> Any | None:
+    """Return the converted ``value`` attribute of ``node``, or None if missing or unconvertible."""
+    if node is not None:
+        val = node.get("value")
+        if val:
+            try:
+                return convert(val)
+            except (ValueError, TypeError):
+                return None
+    return None
+
+
+def _get_val(item: ET._Element, tag: str, convert: Callable[[str], Any] = str) -> Any | None:
+    """Return the converted ``value`` attribute of ``item``'s first ``tag`` child, or None."""
+    return _node_val(item.find(tag), convert)
+
+
+class _ItemListSchema(BaseModel, ABC):
+    """Base for containers parsed from a root whose children are one repeated element.
+
+    Subclasses implement ``_parse_item`` for a single ``_ITEM_TAG`` element and store the
+    parsed models in the ``_ITEMS_FIELD`` field.
+    """
+
+    _ITEM_TAG: ClassVar[str] = "item"
+    _ITEMS_FIELD: ClassVar[str] = "items"
+
+    @classmethod
+    def parse_xml_file(cls, path: str | os.PathLike[str]) -> Self:
+        """Parses a saved response from disk, letting libxml2 read the file directly.
+
+        Args:
+            path: Path of the XML file.
+
+        Returns:
+            An instance containing the parsed items.
+        """
+        elems = _iter_source_children(os.fspath(path), cls._ITEM_TAG)
+        return cls.model_construct(**{cls._ITEMS_FIELD: [cls._parse_item(elem) for elem in elems]})
+
+    @classmethod
+    def parse_xml_stream(cls, source: str | bytes | BinaryIO) -> Iterator[BaseModel]:
+        """Parses a response lazily, yielding each item as its element closes.
+
+        Args:
+            source: The raw XML response as text or bytes, or a binary file object
+                (e.g. an open file or a raw response stream) read incrementally.
+
+        Yields:
+            Parsed item models in document order.
+        """
+        for elem in _iter_children(source, cls._ITEM_TAG):
+            yield cls._parse_item(elem)
+
+    @staticmethod
+    @abstractmethod
+    def _parse_item(item: ET._Element) -> BaseModel:
+        """Parses a single child element into its item model."""
 
 
 class ThingItem(BaseModel):
@@ -52,13 +212,12 @@ class ThingItem(BaseModel):
 
     @field_validator("type")
     def validate_type(cls, v: str | None) -> str | None:
-        allowed = {"boardgame", "boardgameexpansion", "boardgameaccessory", "videogame", "rpgitem", "rpgissue"}
-        if v is not None and v not in allowed:
+        if v is not None and v not in _VALID_THING_TYPES:
             raise ValueError(f"Invalid type: {v}")
         return v
 
 
-class ThingSchema(BaseModel):
+class ThingSchema(_ItemListSchema):
     """Container for a list of ThingItems parsed from the 'thing' endpoint.
 
     Attributes:
@@ -68,88 +227,91 @@ class ThingSchema(BaseModel):
     items: list[ThingItem] = []
 
     @classmethod
-    def parse_xml(cls, xml_text: str) -> "ThingSchema":
+    def parse_xml(cls, xml_text: str | bytes) -> "ThingSchema":
         """Parses XML response from the 'thing' endpoint.
 
         Args:
-            xml_text: The raw XML string from the API.
+            xml_text: The raw XML response from the API, as text or bytes.
 
         Returns:
             A ThingSchema instance containing the parsed items.
         """
-        root = ET.fromstring(xml_text)
-        items = []
-        for item in root.findall("item"):
-            item_id = item.attrib.get("id")
-
-            # Helper to get value from simple tag
-            def get_val(tag: str, convert: Callable[[str], Any] = str) -> Any | None:
-                node = item.find(tag)
-                if node is not None:
-                    val = node.attrib.get("value")
-                    if val:
-                        try:
-                            return convert(val)
-                        except (ValueError, TypeError):
-                            return None
-                return None
+        return cls.model_construct(items=[cls._parse_item(item) for item in _iter_children(xml_text, "item")])
 
-            # Helper to get text content
-            def get_text(tag: str) -> str | None:
-                node = item.find(tag)
-                return node.text if node is not None else None
+    @classmethod
+    async def from_element_stream(cls, elements: AsyncIterator[ET._Element]) -> "ThingSchema":
+        """Builds a ThingSchema from ``<item>`` elements yielded by an incremental parser.
 
-            # Helper to get list of values from links
-            def get_links(link_type: str) -> list[str]:
-                return [
-                    val
-                    for link in item.findall("link")
-                    if link.attrib.get("type") == link_type and (val := link.attrib.get("value")) is not None
-                ]
+        Args:
+            elements: Async iterator of top-level ``<item>`` elements.
+
+        Returns:
+            A ThingSchema instance containing the parsed items.
+        """
+        return cls.model_construct(items=[cls._parse_item(item) async for item in elements])
+
+    @staticmethod
+    def _parse_item(item: ET._Element) -> ThingItem:
+        """Parses a single ``<item>`` element from the 'thing' endpoint.
+
+        Args:
+            item: The ``<item>`` element.
 
-            usersrated = None
-            average = None
-            rank = None
-            stats = item.find("statistics")
-            if stats is not None:
-                ratings = stats.find("ratings")
-                if ratings is not None:
-                    usersrated = ratings.attrib.get("usersrated")
-                    average = ratings.attrib.get("average")
-                    ranks = ratings.find("ranks")
-                    if ranks is not None:
-                        # Get the main boardgame rank (id=1)
-                        bg_rank = ranks.find("rank[@id='1']")
-                        if bg_rank is not None:
-                            rank_val = bg_rank.attrib.get("value")
-                            if rank_val and rank_val != "Not Ranked":
-                                rank = int(rank_val)
-
-            items.append(
-                ThingItem(
-                    id=int(item_id) if item_id else None,
-                    type=cast(ThingType, item.attrib.get("type"))
-                    if item.attrib.get("type")
-                    in ["boardgame", "boardgameexpansion", "boardgameaccessory", "videogame", "rpgitem", "rpgissue"]
-                    else None,
-                    name=get_val("name"),  # Primary name usually has type="primary" but value attribute is standard
-                    description=get_text("description"),
-                    yearpublished=get_val("yearpublished", int),
-                    minplayers=get_val("minplayers", int),
-                    maxplayers=get_val("maxplayers", int),
-                    playingtime=get_val("playingtime", int),
-                    minage=get_val("minage", int),
-                    usersrated=int(usersrated) if usersrated else None,
-                    average=float(average) if average else None,
-                    rank=rank,
-                    categories=get_links("boardgamecategory"),
-                    mechanics=get_links("boardgamemechanic"),
-                    designers=get_links("boardgamedesigner"),
-                    artists=get_links("boardgameartist"),
-                    publishers=get_links("boardgamepublisher"),
-                )
-            )
-        return cls(items=items)
+        Returns:
+            The parsed ThingItem.
+        """
+        item_id = item.get("id")
+        raw_type = item.get("type")
+
+        # One pass over the children: first element per tag (the first <name> is the primary one)
+        # and <link> values grouped by link type.
+        children: dict[str, ET._Element] = {}
+        links: dict[str, list[str]] = {}
+        for child in item:
+            if child.tag == "link":
+                val = child.get("value")
+                if val is not None:
+                    links.setdefault(child.get("type"), []).append(val)
+            else:
+                children.setdefault(child.tag, child)
+
+        usersrated = None
+        average = None
+        rank = None
+        stats = children.get("statistics")
+        if stats is not None:
+            ratings_nodes = _RATINGS_XPATH(stats)
+            if ratings_nodes:
+                ratings = ratings_nodes[0]
+                usersrated = ratings.get("usersrated")
+                average = ratings.get("average")
+                bg_rank = _MAIN_RANK_XPATH(ratings)
+                if bg_rank:
+                    rank_val = bg_rank[0].get("value")
+                    if rank_val and rank_val != "Not Ranked":
+                        rank = int(rank_val)
+
+        return ThingItem.model_construct(
+            id=int(item_id) if item_id else None,
+            type=cast(ThingType, raw_type) if raw_type in _VALID_THING_TYPES else None,
+            name=_node_val(
+                children.get("name")
+            ),  # Primary name usually has type="primary" but value attribute is standard
+            description=description.text if (description := children.get("description")) is not None else None,
+            yearpublished=_node_val(children.get("yearpublished"), int),
+            minplayers=_node_val(children.get("minplayers"), int),
+            maxplayers=_node_val(children.get("maxplayers"), int),
+            playingtime=_node_val(children.get("playingtime"), int),
+            minage=_node_val(children.get("minage"), int),
+            usersrated=int(usersrated) if usersrated else None,
+            average=float(average) if average else None,
+            rank=rank,
+            categories=links.get("boardgamecategory", []),
+            mechanics=links.get("boardgamemechanic", []),
+            designers=links.get("boardgamedesigner", []),
+            artists=links.get("boardgameartist", []),
+            publishers=links.get("boardgamepublisher", []),
+        )
 
 
 class UserSchema(BaseModel):
@@ -176,16 +338,16 @@ class UserSchema(BaseModel):
     top: list[dict[str, Any]] = []
 
     @classmethod
-    def parse_xml(cls, xml_text: str) -> "UserSchema":
+    def parse_xml(cls, xml_text: str | bytes) -> "UserSchema":
         """Parses XML response from the 'user' endpoint.
 
         Args:
-            xml_text: The raw XML string from the API.
+            xml_text: The raw XML response from the API, as text or bytes.
 
         Returns:
             A UserSchema instance. Returns an empty schema if the user tag is missing.
         """
-        root = ET.fromstring(xml_text)
+        root = _fromstring(xml_text)
         if root.tag == "user":
             usr = root
         else:
@@ -194,31 +356,22 @@ class UserSchema(BaseModel):
         if usr is None:
             return cls()
 
-        def get_val(tag: str, convert: Callable[[str], Any] = str) -> Any | None:
-            node = usr.find(tag)
-            if node is not None:
-                val = node.attrib.get("value")
-                if val:
-                    try:
-                        return convert(val)
-                    except (ValueError, TypeError):
-                        return None
-            return None
-
         def get_list(tag_name: str) -> list[dict[str, Any]]:
             node = usr.find(tag_name)
             if node is not None:
-                return [item.attrib for item in node.findall("item") or node.findall("buddy") or node.findall("guild")]
+                return [
+                    dict(item.attrib) for item in node.findall("item") or node.findall("buddy") or node.findall("guild")
+                ]
             return []
 
-        user_id = usr.attrib.get("id")
-        return cls(
+        user_id = usr.get("id")
+        return cls.model_construct(
             id=int(user_id) if user_id else None,
-            name=usr.attrib.get("name"),
-            firstname=get_val("firstname"),
-            lastname=get_val("lastname"),
-            avatar=get_val("avatar"),
-            registered=get_val("yearregistered"),
+            name=usr.get("name"),
+            firstname=_get_val(usr, "firstname"),
+            lastname=_get_val(usr, "lastname"),
+            avatar=_get_val(usr, "avatar"),
+            registered=_get_val(usr, "yearregistered"),
             buddies=get_list("buddies"),
             guilds=get_list("guilds"),
             hot=get_list("hot"),
@@ -248,7 +401,7 @@ class CollectionItem(BaseModel):
     comment: str | None = None
 
 
-class CollectionSchema(BaseModel):
+class CollectionSchema(_ItemListSchema):
     """Container for a list of CollectionItems parsed from the 'collection' endpoint.
 
     Attributes:
@@ -258,49 +411,92 @@ class CollectionSchema(BaseModel):
     items: list[CollectionItem] = []
 
     @classmethod
-    def parse_xml(cls, xml_text: str) -> "CollectionSchema":
+    def parse_xml(cls, xml_text: str | bytes) -> "CollectionSchema":
         """Parses XML response from the 'collection' endpoint.
 
         Args:
-            xml_text: The raw XML string from the API.
+            xml_text: The raw XML response from the API, as text or bytes.
 
         Returns:
             A CollectionSchema instance containing the parsed items.
         """
-        root = ET.fromstring(xml_text)
-        items = []
-        for item in root.findall("item"):
-            name_node = item.find("name")
-            stats = item.find("stats")
-            status_node = item.find("status")
-            comment_node = item.find("comment")
-
-            rating = None
-            if stats is not None:
-                rating_node = stats.find("rating")
-                if rating_node is not None:
-                    val = rating_node.attrib.get("value")
-                    if val and val != "N/A":
-                        rating = val
-                elif stats.attrib.get("rating"):
-                    rating = stats.attrib.get("rating")
-
-            objectid_val = item.attrib.get("objectid")
-            collid_val = item.attrib.get("collid")
-            items.append(
-                CollectionItem(
-                    objectid=int(objectid_val) if objectid_val else None,
-                    subtype=item.attrib.get("subtype"),
-                    collid=int(collid_val) if collid_val else None,
-                    name=name_node.text
-                    if name_node is not None and name_node.text
-                    else (name_node.attrib.get("value") if name_node is not None else None),
-                    rating=float(rating) if rating else None,
-                    status=status_node.attrib if status_node is not None else {},
-                    comment=comment_node.text if comment_node is not None else None,
-                )
-            )
-        return cls(items=items)
+        return cls.model_construct(items=[cls._parse_item(item) for item in _iter_children(xml_text, "item")])
+
+    @classmethod
+    async def from_element_stream(cls, elements: AsyncIterator[ET._Element]) -> "CollectionSchema":
+        """Builds a CollectionSchema from ``<item>`` elements yielded by an incremental parser.
+
+        Args:
+            elements: Async iterator of top-level ``<item>`` elements.
+
+        Returns:
+            A CollectionSchema instance containing the parsed items.
+        """
+        return cls.model_construct(items=[cls._parse_item(item) async for item in elements])
+
+    @staticmethod
+    def _parse_item(item: ET._Element) -> CollectionItem:
+        """Parses a single ``<item>`` element from the 'collection' endpoint.
+
+        Args:
+            item: The ``<item>`` element.
+
+        Returns:
+            The parsed CollectionItem.
+        """
+        children = _first_children(item)
+        name_node = children.get("name")
+        stats = children.get("stats")
+        status_node = children.get("status")
+        comment_node = children.get("comment")
+
+        rating = None
+        if stats is not None:
+            rating_nodes = _RATING_XPATH(stats)
+            if rating_nodes:
+                val = rating_nodes[0].get("value")
+                if val and val != "N/A":
+                    rating = val
+            elif stats.get("rating"):
+                rating = stats.get("rating")
+
+        objectid_val = item.get("objectid")
+        collid_val = item.get("collid")
+        return CollectionItem.model_construct(
+            objectid=int(objectid_val) if objectid_val else None,
+            subtype=item.get("subtype"),
+            collid=int(collid_val) if collid_val else None,
+            name=name_node.text
+            if name_node is not None and name_node.text
+            else (name_node.get("value") if name_node is not None else None),
+            rating=float(rating) if rating else None,
+            status=dict(status_node.attrib) if status_node is not None else {},
+            comment=comment_node.text if comment_node is not None else None,
+        )
+
+
+class PlaySubItem(BaseModel):
+    """The game a play was logged for.
+
+    Supports ``item["name"]`` lookups for code written against the former dict form.
+
+    Attributes:
+        name: The name of the game.
+        objecttype: The type of object (usually 'thing').
+        objectid: The BGG ID of the game.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str | None = None
+    objecttype: str | None = None
+    objectid: int | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a field by name, like the former ``dict`` representation."""
+        if key not in type(self).model_fields:
+            raise KeyError(key)
+        return getattr(self, key)
 
 
 class PlayItem(BaseModel):
@@ -313,7 +509,7 @@ class PlayItem(BaseModel):
         length: The duration of the play in minutes.
         location: Location where the play occurred.
         comment: Comments about the play.
-        item: A dictionary containing details about the game played (name, id, etc.).
+        item: The game played (name, type and ID).
         players: List of players involved in the play.
     """
 
@@ -323,55 +519,75 @@ class PlayItem(BaseModel):
     length: int | None = None
     location: str | None = None
     comment: str | None = None
-    item: dict[str, Any] | None = None
+    item: PlaySubItem | None = None
     players: list[dict[str, Any]] = []
 
 
-class PlaysSchema(BaseModel):
+def _parse_play_item(elem: ET._Element) -> PlaySubItem:
+    """Build a PlaySubItem from a play's ``<item>`` element."""
+    objectid = elem.get("objectid")
+    return PlaySubItem.model_construct(
+        name=elem.get("name"),
+        objecttype=elem.get("objecttype"),
+        objectid=int(objectid) if objectid else None,
+    )
+
+
+class PlaysSchema(_ItemListSchema):
     """Container for a list of PlayItems parsed from the 'plays' endpoint.
 
     Attributes:
         plays: A list of PlayItem objects.
     """
 
+    _ITEM_TAG: ClassVar[str] = "play"
+    _ITEMS_FIELD: ClassVar[str] = "plays"
+
     plays: list[PlayItem] = []
 
     @classmethod
-    def parse_xml(cls, xml_text: str) -> "PlaysSchema":
+    def parse_xml(cls, xml_text: str | bytes) -> "PlaysSchema":
         """Parses XML response from the 'plays' endpoint.
 
         Args:
-            xml_text: The raw XML string from the API.
+            xml_text: The raw XML response from the API, as text or bytes.
 
         Returns:
             A PlaysSchema instance containing the parsed plays.
         """
-        root = ET.fromstring(xml_text)
-        plays = []
-        for p in root.findall("play"):
-            players = []
-            players_node = p.find("players")
-            if players_node is not None:
-                players = [pl.attrib for pl in players_node.findall("player")]
-
-            comments_elem = p.find("comments")
-            item_elem = p.find("item")
-            play_id = p.attrib.get("id")
-            quantity = p.attrib.get("quantity")
-            length = p.attrib.get("length")
-            plays.append(
-                PlayItem(
-                    id=int(play_id) if play_id else None,
-                    date=p.attrib.get("date"),
-                    quantity=int(quantity) if quantity else None,
-                    length=int(length) if length else None,
-                    location=p.attrib.get("location"),
-                    comment=comments_elem.text if comments_elem is not None else None,
-                    item=item_elem.attrib if item_elem is not None else None,
-                    players=players,
-                )
-            )
-        return cls(plays=plays)
+        return cls.model_construct(plays=[cls._parse_item(p) for p in _iter_children(xml_text, "play")])
+
+    @staticmethod
+    def _parse_item(p: ET._Element) -> PlayItem:
+        """Parses a single ``<play>`` element from the 'plays' endpoint.
+
+        Args:
+            p: The ``<play>`` element.
+
+        Returns:
+            The parsed PlayItem.
+        """
+        children = _first_children(p)
+        players = []
+        players_node = children.get("players")
+        if players_node is not None:
+            players = [dict(pl.attrib) for pl in _PLAYER_XPATH(players_node)]
+
+        comments_elem = children.get("comments")
+        item_elem = children.get("item")
+        play_id = p.get("id")
+        quantity = p.get("quantity")
+        length = p.get("length")
+        return PlayItem.model_construct(
+            id=int(play_id) if play_id else None,
+            date=p.get("date"),
+            quantity=int(quantity) if quantity else None,
+            length=int(length) if length else None,
+            location=p.get("location"),
+            comment=comments_elem.text if comments_elem is not None else None,
+            item=_parse_play_item(item_elem) if item_elem is not None else None,
+            players=players,
+        )
 
 
 class SearchQuery(BaseModel):
@@ -391,10 +607,7 @@ class SearchQuery(BaseModel):
         Returns:
             A SearchQuery instance.
         """
-        import re
-
-        query = re.sub(" ", "+", query)
-        return cls(query=query)
+        return cls(query=query.replace(" ", "+"))
 
     @classmethod
     def from_types(cls, query: str, types: list[ThingType]) -> "SearchQuery":
@@ -416,19 +629,15 @@ class SearchQuery(BaseModel):
         Returns:
             The formatted query string (e.g., "search?query=foo&type=boardgame&exact=1").
         """
-        params = [f"query={self.query}"]
-
+        params = [("query", self.query)]
         if self.types:
-            type_str = ",".join(self.types)
-            params.append(f"type={type_str}")
-
+            params.append(("type", ",".join(self.types)))
         if self.exact:
-            params.append("exact=1")
-
-        return f"search?{'&'.join(params)}"
+            params.append(("exact", "1"))
+        return "search?" + urlencode(params, safe="+,")
 
 
-class SearchSchema(BaseModel):
+class SearchSchema(_ItemListSchema):
     """Container for search results parsed from the 'search' endpoint.
 
     Attributes:
@@ -438,37 +647,40 @@ class SearchSchema(BaseModel):
     items: list[ThingItem] = []
 
     @classmethod
-    def parse_xml(cls, xml_text: str) -> "SearchSchema":
+    def parse_xml(cls, xml_text: str | bytes) -> "SearchSchema":
         """Parses XML response from the 'search' endpoint.
 
         Args:
-            xml_text: The raw XML string from the API.
+            xml_text: The raw XML response from the API, as text or bytes.
 
         Returns:
             A SearchSchema instance containing the parsed items.
         """
-        root = ET.fromstring(xml_text)
-        items = []
-        for item in root.findall("item"):
-            item_id = item.attrib.get("id")
-            name = item.find("name")
-            year = item.find("yearpublished")
-
-            # Search results don't usually have stats, but share the same basic structure
-            items.append(
-                ThingItem(
-                    id=int(item_id) if item_id else None,
-                    type=cast(ThingType, item.attrib.get("type"))
-                    if item.attrib.get("type")
-                    in ["boardgame", "boardgameexpansion", "boardgameaccessory", "videogame", "rpgitem", "rpgissue"]
-                    else None,
-                    name=name.attrib.get("value") if name is not None else None,
-                    yearpublished=int(year.attrib.get("value"))
-                    if year is not None and year.attrib.get("value")
-                    else None,
-                )
-            )
-        return cls(items=items)
+        return cls.model_construct(items=[cls._parse_item(item) for item in _iter_children(xml_text, "item")])
+
+    @staticmethod
+    def _parse_item(item: ET._Element) -> ThingItem:
+        """Build a ThingItem from a search result ``<item>`` element.
+
+        Args:
+            item: The ``<item>`` element.
+
+        Returns:
+            The parsed ThingItem.
+        """
+        item_id = item.get("id")
+        raw_type = item.get("type")
+        children = _first_children(item)
+        name = children.get("name")
+        year = children.get("yearpublished")
+
+        # Search results don't usually have stats, but share the same basic structure
+        return ThingItem.model_construct(
+            id=int(item_id) if item_id else None,
+            type=cast(ThingType, raw_type) if raw_type in _VALID_THING_TYPES else None,
+            name=name.get("value") if name is not None else None,
+            yearpublished=int(year.get("value")) if year is not None and year.get("value") else None,
+        )
 
 
 class FamilyItem(BaseModel):
@@ -487,7 +699,7 @@ class FamilyItem(BaseModel):
     description: str | None = None
 
 
-class FamilySchema(BaseModel):
+class FamilySchema(_ItemListSchema):
     """Container for a list of FamilyItems parsed from the 'family' endpoint.
 
     Attributes:
@@ -497,28 +709,34 @@ class FamilySchema(BaseModel):
     items: list[FamilyItem] = []
 
     @classmethod
-    def parse_xml(cls, xml_text: str) -> "FamilySchema":
+    def parse_xml(cls, xml_text: str | bytes) -> "FamilySchema":
         """Parses XML response from the 'family' endpoint.
 
         Args:
-            xml_text: The raw XML string from the API.
+            xml_text: The raw XML response from the API, as text or bytes.
 
         Returns:
             A FamilySchema instance containing the parsed items.
         """
-        root = ET.fromstring(xml_text)
-        items = []
-        for item in root.findall("item"):
-            item_id = item.attrib.get("id")
-            name = item.find("name")
-            desc = item.find("description")
-
-            items.append(
-                FamilyItem(
-                    id=int(item_id) if item_id else None,
-                    type=item.attrib.get("type"),
-                    name=name.attrib.get("value") if name is not None else None,
-                    description=desc.text if desc is not None else None,
-                )
-            )
-        return cls(items=items)
+        return cls.model_construct(items=[cls._parse_item(item) for item in _iter_children(xml_text, "item")])
+
+    @staticmethod
+    def _parse_item(item: ET._Element) -> FamilyItem:
+        """Build a FamilyItem from a family ``<item>`` element.
+
+        Args:
+            item: The ``<item>`` element.
+
+        Returns:
+            The parsed FamilyItem.
+        """
+        item_id = item.get("id")
+        children = _first_children(item)
+        name = children.get("name")
+        desc = children.get("description")
+        return FamilyItem.model_construct(
+            id=int(item_id) if item_id else None,
+            type=item.get("type"),
+            name=name.get("value") if name is not None else None,
+            description=desc.text if desc is not None else None,
+        )
@@ -2,9 +2,17 @@
 Storage backend interface for BGG Extractor.
 """
 
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import PurePosixPath
 from typing import Any
 
+# Writes are I/O-bound (disk or network), so the pool is sized well past the core count.
+_WRITE_WORKERS = min(32, 4 * (os.cpu_count() or 1))
+_DATAFRAME_FORMATS = ("parquet", "csv", "json")
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
@@ -49,3 +57,31 @@ class StorageBackend(ABC):
             The URI or path of the written file.
         """
         raise NotImplementedError
+
+    def write_many(self, items: Iterable[tuple[str, Any]]) -> list[str]:
+        """Write several payloads concurrently on a thread pool reused across calls.
+
+        Bytes go to ``write_bytes``, DataFrames and pyarrow Tables to ``write_dataframe``
+        (format taken from the path suffix, defaulting to parquet), and anything else
+        to ``write_json``.
+
+        Args:
+            items: (path, payload) pairs.
+
+        Returns:
+            The URIs or paths of the written files, in input order.
+        """
+        pool = getattr(self, "_write_pool", None)
+        if pool is None:
+            pool = self._write_pool = ThreadPoolExecutor(max_workers=_WRITE_WORKERS)
+        futures = [pool.submit(self._write_one, path, payload) for path, payload in items]
+        return [f.result() for f in futures]
+
+    def _write_one(self, path: str, payload: Any) -> str:
+        """Dispatch a single write_many payload to the matching writer."""
+        if isinstance(payload, (bytes, bytearray, memoryview)):
+            return self.write_bytes(path, bytes(payload))
+        if hasattr(payload, "columns"):
+            suffix = PurePosixPath(path).suffix.lstrip(".").lower()
+            return self.write_dataframe(path, payload, fmt=suffix if suffix in _DATAFRAME_FORMATS else "parquet")
+        return self.write_json(path, payload)
@@ -6,16 +6,43 @@ import json
 from pathlib import Path
 from typing import Any
 
+import orjson
 import pandas as pd
+import pyarrow as pa
 
 from bgg_extractor.storage.base import StorageBackend
 from bgg_extractor.storage.utils import (
     coerce_dataframe_types,
     normalize_dataframe_columns,
+    write_bytes_atomic,
     write_csv_atomic,
     write_parquet_atomic,
 )
 
+# Datetimes are passed to ``default=str`` so they keep the stdlib encoder's text
+# ("2020-01-01 00:00:00+00:00") rather than orjson's RFC 3339 form.
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+# One JSON object per line; NumPy scalars are encoded natively and NaN becomes null.
+_NDJSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | _JSON_OPTIONS
+
+
+def _records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert a DataFrame to row dicts via Arrow's C++ column-to-row conversion.
+
+    Missing values become None. Frames Arrow cannot convert (e.g. mixed-type object
+    columns) fall back to ``df.to_dict(orient="records")``.
+
+    Args:
+        df: The DataFrame to convert.
+
+    Returns:
+        One dict per row.
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return df.to_dict(orient="records")
+
 
 class LocalStorage(StorageBackend):
     """Local filesystem storage backend.
@@ -58,14 +85,15 @@ class LocalStorage(StorageBackend):
             The absolute path of the written file as a string.
         """
         p = self._resolve(path)
-        tmp = p.with_suffix(p.suffix + ".tmp")
-        tmp.write_bytes(data)
-        tmp.replace(p)
+        write_bytes_atomic(data, p.as_posix())
         return str(p)
 
     def write_json(self, path: str, obj: Any, ensure_ascii: bool = False, indent: int = 2) -> str:
         """Write a Python object as JSON atomically.
 
+        Serialized with orjson in one pass. The stdlib encoder is only used for options orjson
+        cannot express (ASCII escaping, or an indent other than 0 or 2).
+
         Args:
             path: Relative path to the file.
             obj: The object to serialize.
@@ -75,23 +103,31 @@ class LocalStorage(StorageBackend):
         Returns:
             The absolute path of the written file as a string.
         """
-        p = self._resolve(path)
-        tmp = p.with_suffix(p.suffix + ".tmp")
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(obj, f, ensure_ascii=ensure_ascii, indent=indent, default=str)
-        tmp.replace(p)
-        return str(p)
+        if ensure_ascii or indent not in (None, 0, 2):
+            data = json.dumps(obj, ensure_ascii=ensure_ascii, indent=indent, default=str).encode("utf-8")
+        else:
+            option = _JSON_OPTIONS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            data = orjson.dumps(obj, default=str, option=option)
+        return self.write_bytes(path, data)
 
     def write_dataframe(
-        self, path: str, df: pd.DataFrame, fmt: str = "parquet", schema: dict[str, str] | None = None, **kwargs
+        self,
+        path: str,
+        df: pd.DataFrame | pa.Table,
+        fmt: str = "parquet",
+        schema: dict[str, str] | None = None,
+        **kwargs,
     ) -> str:
         """Write a pandas DataFrame to a file.
 
         Supports parquet, csv, and json formats. Handles column normalization and type coercion.
+        A pyarrow Table (e.g. from ``transform.models_to_arrow``) is written as-is, skipping both.
 
         Args:
             path: Relative path to the output file.
-            df: The pandas DataFrame to write.
+            df: The pandas DataFrame (or pyarrow Table) to write.
             fmt: Output format ('parquet', 'csv', 'json').
             schema: Optional dictionary mapping column names to types for coercion.
             **kwargs: Additional arguments passed to the underlying writer function.
@@ -102,6 +138,9 @@ class LocalStorage(StorageBackend):
         Raises:
             ValueError: If an unsupported format is specified.
         """
+        if isinstance(df, pa.Table):
+            return self._write_table(path, df, fmt, **kwargs)
+
         df2 = normalize_dataframe_columns(df)
         if schema:
             df2 = coerce_dataframe_types(df2, schema)
@@ -113,15 +152,44 @@ class LocalStorage(StorageBackend):
         elif fmt.lower() == "csv":
             return write_csv_atomic(df2, self._resolve(path).as_posix(), index=False, **kwargs)
         elif fmt.lower() == "json":
+            records = _records(df2)
             if kwargs.get("ndjson", False):
                 p = self._resolve(path)
                 tmp = p.with_suffix(p.suffix + ".tmp")
-                with open(tmp, "w", encoding="utf-8") as f:
-                    for row in df2.to_dict(orient="records"):
-                        f.write(json.dumps(row, default=str, ensure_ascii=False) + "\n")
+                with open(tmp, "wb", buffering=1 << 20) as f:
+                    for record in records:
+                        f.write(orjson.dumps(record, default=str, option=_NDJSON_OPTIONS))
                 tmp.replace(p)
                 return str(p)
             else:
-                return self.write_json(path, df2.to_dict(orient="records"))
+                return self.write_json(path, records)
+        else:
+            raise ValueError("Unsupported format: choose parquet, csv, json")
+
+    def _write_table(self, path: str, table: pa.Table, fmt: str, **kwargs) -> str:
+        """Write a pyarrow Table without a pandas round-trip.
+
+        Args:
+            path: Relative path to the output file.
+            table: The pyarrow Table to write.
+            fmt: Output format ('parquet', 'csv', 'json').
+            **kwargs: Additional arguments passed to the underlying writer function.
+
+        Returns:
+            The absolute path of the written file as a string.
+
+        Raises:
+            ValueError: If an unsupported format is specified.
+        """
+        if fmt.lower() == "parquet":
+            return write_parquet_atomic(table, self._resolve(path).as_posix(), **kwargs)
+        elif fmt.lower() == "csv":
+            return write_csv_atomic(table, self._resolve(path).as_posix(), **kwargs)
+        elif fmt.lower() == "json":
+            records = table.to_pylist()
+            if kwargs.get("ndjson", False):
+                data = b"".join(orjson.dumps(r, default=str, option=_NDJSON_OPTIONS) for r in records)
+                return self.write_bytes(path, data)
+            return self.write_json(path, records)
         else:
             raise ValueError("Unsupported format: choose parquet, csv, json")
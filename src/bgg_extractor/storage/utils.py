@@ -3,15 +3,26 @@ Helper functions for handing column naming patterns, type coercion,
 and atomic writes.
 """
 
+import contextlib
+import functools
+import os
 import re
 import unicodedata
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+_NON_WORD = re.compile(r"[^\w]+")
+_MULTI_UNDERSCORE = re.compile(r"_+")
+
+# Rows converted to Arrow and written per Parquet row group.
+_PARQUET_CHUNK_ROWS = 64_000
+# Bytes handed to each os.write call by write_bytes_atomic.
+_WRITE_CHUNK_BYTES = 1 << 20
+
 
 def normalize_column_name(col: str) -> str:
     """Normalize a column name to be filesystem-safe and consistent.
@@ -27,17 +38,37 @@ def normalize_column_name(col: str) -> str:
     """
     if col is None:
         return ""
-    s = str(col).strip()
+    # Non-str labels (ints, tuples) are stringified first so the cache only ever sees str keys.
+    return _normalize_name(str(col))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_name(col: str) -> str:
+    """Memoized body of ``normalize_column_name``; column names repeat across batches."""
+    s = col.strip()
     s = unicodedata.normalize("NFKD", s)
     s = s.encode("ascii", "ignore").decode("ascii")
-    s = re.sub(r"[^\w]+", "_", s)
-    s = re.sub(r"_+", "_", s)
+    s = _NON_WORD.sub("_", s)
+    s = _MULTI_UNDERSCORE.sub("_", s)
     s = s.strip("_").lower()
     if s == "":
         s = "col"
     return s
 
 
+def _is_normalized(col: Any) -> bool:
+    """Return True if ``normalize_column_name(col)`` would return ``col`` unchanged."""
+    return (
+        isinstance(col, str)
+        and col.isascii()
+        and col.isidentifier()
+        and col.islower()
+        and "__" not in col
+        and not col.startswith("_")
+        and not col.endswith("_")
+    )
+
+
 def normalize_dataframe_columns(df: pd.DataFrame, rename_map: dict[str, str] | None = None) -> pd.DataFrame:
     """Normalize all column names in a DataFrame.
 
@@ -49,12 +80,10 @@ def normalize_dataframe_columns(df: pd.DataFrame, rename_map: dict[str, str] | N
         A new DataFrame with normalized column names.
     """
     rename_map = rename_map or {}
-    new_cols = {}
-    for col in df.columns:
-        if col in rename_map:
-            new_cols[col] = rename_map[col]
-        else:
-            new_cols[col] = normalize_column_name(col)
+    if all(_is_normalized(col) for col in df.columns):
+        return df.rename(columns=rename_map) if rename_map else df.copy(deep=False)
+    normalized = df.columns.map(normalize_column_name)
+    new_cols = {col: rename_map.get(col, name) for col, name in zip(df.columns, normalized, strict=True)}
     return df.rename(columns=new_cols)
 
 
@@ -69,48 +98,80 @@ def coerce_dataframe_types(df: pd.DataFrame, schema: dict[str, Any] | None = Non
         A new DataFrame with coerced types.
     """
     if schema:
+        # Coerced columns are collected and the frame rebuilt once, instead of assigning
+        # into df per column (which fragments and re-consolidates its blocks).
+        out_cols: dict[str, pd.Series] = {}
         for col, dtype in schema.items():
-            if col not in df.columns:
-                df[col] = pd.NA
+            series = df[col] if col in df.columns else pd.Series(pd.NA, index=df.index, name=col)
             try:
                 if isinstance(dtype, str) and dtype.startswith("datetime"):
-                    df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
+                    out_cols[col] = pd.to_datetime(series, utc=True, errors="coerce")
                 else:
-                    df[col] = df[col].astype(dtype, copy=False)
+                    out_cols[col] = series.astype(dtype)
             except Exception:
                 try:
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
+                    out_cols[col] = pd.to_numeric(series, errors="coerce")
                 except Exception:
-                    df[col] = df[col].astype(object)
+                    out_cols[col] = series.astype(object)
         remaining = [c for c in df.columns if c not in schema]
-        df = df[[*schema.keys(), *remaining]]
-        return df
+        return pd.concat([pd.DataFrame(out_cols, index=df.index), df[remaining]], axis=1)
     else:
-        for col in df.columns:
-            if df[col].dtype == object:
-                sample = df[col].dropna().astype(str)
-                if len(sample) == 0:
-                    continue
-                try_vals = sample.sample(min(len(sample), 20), random_state=0)
-                date_like = 0
-                for v in try_vals:
-                    try:
-                        pd.to_datetime(v)
-                        date_like += 1
-                    except Exception:  # noqa: S110 - Expected to fail for non-date values
-                        pass
-                if date_like >= len(try_vals) * 0.8:
-                    df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
+        object_cols = [col for col, dtype in df.dtypes.items() if pd.api.types.is_object_dtype(dtype)]
+        for col in object_cols:
+            sample = df[col].dropna().astype(str)
+            if len(sample) == 0:
+                continue
+            try_vals = sample.sample(min(len(sample), 20), random_state=0)
+            # One parse call for the whole sample; "mixed" parses each value on its own like the scalar calls did.
+            parsed = pd.to_datetime(try_vals, errors="coerce", utc=True, format="mixed")
+            if parsed.notna().mean() >= 0.8:
+                df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
         return df
 
 
-def write_parquet_atomic(df: pd.DataFrame, out_path: str, **kwargs) -> str:
+def write_bytes_atomic(data: bytes, out_path: str) -> str:
+    """Write bytes to a file atomically.
+
+    The temporary file is preallocated to its final size where ``os.posix_fallocate`` is
+    available, so the filesystem can reserve contiguous extents, then written in 1 MiB chunks.
+
+    Args:
+        data: Bytes to write.
+        out_path: Destination path.
+
+    Returns:
+        The output path as a string.
+    """
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_suffix(out.suffix + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        if data and hasattr(os, "posix_fallocate"):
+            # e.g. filesystems without fallocate support
+            with contextlib.suppress(OSError):
+                os.posix_fallocate(fd, 0, len(data))
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view[:_WRITE_CHUNK_BYTES])
+            view = view[written:]
+    finally:
+        os.close(fd)
+    tmp.replace(out)
+    return out.as_posix()
+
+
+def write_parquet_atomic(df: pd.DataFrame | pa.Table, out_path: str, **kwargs) -> str:
     """Write DataFrame to Parquet atomically.
 
+    The frame is converted to Arrow and written one row group at a time, so only one chunk
+    is duplicated in Arrow memory at once. Defaults to zstd compression with dictionary encoding.
+
     Args:
-        df: DataFrame to write.
+        df: DataFrame or pyarrow Table to write.
         out_path: Destination path.
-        **kwargs: Arguments for pyarrow.parquet.write_table.
+        **kwargs: Arguments for pyarrow.parquet.ParquetWriter, plus ``row_group_size``
+            (rows per row group, default 64,000).
 
     Returns:
         The output path as a string.
@@ -119,17 +180,38 @@ def write_parquet_atomic(df: pd.DataFrame, out_path: str, **kwargs) -> str:
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
     tmp = out.with_suffix(out.suffix + ".tmp")
-    table = pa.Table.from_pandas(df, preserve_index=False)
-    pq.write_table(table, tmp.as_posix(), **kwargs)
+    write_parquet_chunks(df, tmp.as_posix(), **kwargs)
     tmp.replace(out)
     return out.as_posix()
 
 
-def write_csv_atomic(df: pd.DataFrame, out_path: str, index: bool = False, **kwargs) -> str:
+def write_parquet_chunks(df: pd.DataFrame | pa.Table, sink: str | BinaryIO, **kwargs) -> None:
+    """Write a DataFrame or Arrow table to a Parquet path or binary file object one row group at a time.
+
+    Args:
+        df: DataFrame or pyarrow Table to write. Tables are written without conversion.
+        sink: Destination path or writable binary file object (left open).
+        **kwargs: Arguments for pyarrow.parquet.ParquetWriter, plus ``row_group_size``
+            (rows per row group, default 64,000).
+    """
+    chunk_rows = kwargs.pop("row_group_size", _PARQUET_CHUNK_ROWS)
+    options = {"compression": "zstd", "use_dictionary": True, "write_statistics": True, **kwargs}
+    if isinstance(df, pa.Table):
+        with pq.ParquetWriter(sink, df.schema, **options) as writer:
+            writer.write_table(df, row_group_size=chunk_rows)
+        return
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(sink, schema, **options) as writer:
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start : start + chunk_rows]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def write_csv_atomic(df: pd.DataFrame | pa.Table, out_path: str, index: bool = False, **kwargs) -> str:
     """Write DataFrame to CSV atomically.
 
     Args:
-        df: DataFrame to write.
+        df: DataFrame or pyarrow Table to write.
         out_path: Destination path.
         index: Whether to write the index.
         **kwargs: Arguments for df.to_csv.
@@ -137,11 +219,31 @@ def write_csv_atomic(df: pd.DataFrame, out_path: str, index: bool = False, **kwa
     Returns:
         The output path as a string.
     """
-    import csv
-
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
     tmp = out.with_suffix(out.suffix + ".tmp")
+    write_csv_sink(df, tmp.as_posix(), index=index, **kwargs)
+    tmp.replace(out)
+    return out.as_posix()
+
+
+def write_csv_sink(df: pd.DataFrame | pa.Table, sink: str | BinaryIO, index: bool = False, **kwargs) -> None:
+    """Write a DataFrame or Arrow table as UTF-8 CSV to a path or binary file object.
+
+    Both inputs are written by ``df.to_csv`` (Arrow tables are converted to pandas first),
+    so the output is formatted the same regardless of input type or column dtypes.
+
+    Args:
+        df: DataFrame or pyarrow Table to write.
+        sink: Destination path or writable binary file object (left open).
+        index: Whether to write the index.
+        **kwargs: Arguments for df.to_csv.
+    """
+    import csv
+
+    if isinstance(df, pa.Table):
+        df = df.to_pandas()
+
     csv_kwargs = {
         "index": index,
         "encoding": "utf-8",
@@ -149,6 +251,4 @@ def write_csv_atomic(df: pd.DataFrame, out_path: str, index: bool = False, **kwa
         "quoting": csv.QUOTE_MINIMAL,
     }
     csv_kwargs.update(kwargs)
-    df.to_csv(tmp.as_posix(), **csv_kwargs)
-    tmp.replace(out)
-    return out.as_posix()
+    df.to_csv(sink, **csv_kwargs)
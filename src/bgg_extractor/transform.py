@@ -5,31 +5,91 @@ into standard Python dictionaries or lists of dictionaries, suitable for further
 or analysis (e.g., with Pandas).
 """
 
-from collections.abc import Sequence
+import functools
+from collections.abc import Iterable, Sequence
 from typing import Any
 
-from pydantic import BaseModel
+import pyarrow as pa
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter
 
 
-def model_to_dict(model: BaseModel) -> dict[str, Any]:
+@functools.lru_cache(maxsize=32)
+def _list_adapter(model_type: type[BaseModel]) -> TypeAdapter:
+    """Return a cached TypeAdapter for a list of one model type."""
+    return TypeAdapter(list[model_type])
+
+
+def model_to_dict(model: BaseModel, *, fast: bool = False) -> dict[str, Any]:
     """Convert a single Pydantic model to a dictionary.
 
     Args:
         model: The Pydantic model instance.
+        fast: If True, return a shallow copy of the instance's field values without entering
+            pydantic-core. Only equivalent to ``model_dump()`` for flat models: nested models
+            are returned as model instances and list/dict values are shared, not copied.
 
     Returns:
         A dictionary representation of the model.
     """
+    if fast:
+        return dict(model.__dict__)
     return model.model_dump()
 
 
-def models_to_list(models: Sequence[BaseModel]) -> list[dict[str, Any]]:
+def models_to_list(models: Iterable[BaseModel]) -> list[dict[str, Any]]:
     """Convert a sequence of Pydantic models to a list of dictionaries.
 
+    Lists holding a single model type are dumped in one pass by a cached TypeAdapter;
+    mixed sequences fall back to per-model ``model_dump()``.
+
     Args:
-        models: A sequence (list, tuple) of Pydantic model instances.
+        models: A sequence (list, tuple) or any iterable of Pydantic model instances, such as
+            the generator returned by a schema's ``parse_xml_stream``.
 
     Returns:
         A list of dictionaries.
     """
+    if not isinstance(models, Sequence):
+        models = list(models)
+    if not models:
+        return []
+    model_type = type(models[0])
+    if all(type(m) is model_type for m in models):
+        return _list_adapter(model_type).dump_python(list(models))
     return [m.model_dump() for m in models]
+
+
+def models_to_json(models: Iterable[BaseModel], indent: int | None = None) -> bytes:
+    """Serialize a sequence of Pydantic models straight to a JSON array, without intermediate dicts.
+
+    Lists holding a single model type go through the cached TypeAdapter's ``dump_json``;
+    mixed sequences are serialized by pydantic-core using each model's own serializer.
+
+    Args:
+        models: A sequence (list, tuple) or any iterable of Pydantic model instances.
+        indent: Optional indentation for pretty-printing.
+
+    Returns:
+        UTF-8 encoded JSON bytes.
+    """
+    if not isinstance(models, Sequence):
+        models = list(models)
+    if models:
+        model_type = type(models[0])
+        if all(type(m) is model_type for m in models):
+            return _list_adapter(model_type).dump_json(list(models), indent=indent)
+    return pydantic_core.to_json(list(models), indent=indent)
+
+
+def models_to_arrow(models: Iterable[BaseModel], schema: pa.Schema | None = None) -> pa.Table:
+    """Convert a sequence of Pydantic models to a pyarrow Table without a pandas intermediate.
+
+    Args:
+        models: A sequence (list, tuple) of Pydantic model instances.
+        schema: Optional Arrow schema; inferred from the records when omitted.
+
+    Returns:
+        A pyarrow Table with one row per model.
+    """
+    return pa.Table.from_pylist(models_to_list(models), schema=schema)
@@ -3,17 +3,39 @@
 Supports saving Pydantic models (or lists of models) to JSON and CSV formats.
 """
 
-import csv
 import json
 from collections.abc import Sequence
 from pathlib import Path
 
+import orjson
+import pandas as pd
 from pydantic import BaseModel
 
+from bgg_extractor.storage.utils import write_csv_sink
+from bgg_extractor.transform import models_to_json
+
+# Indented like the previous json.dump(indent=2) output; non-string dict keys are stringified as json does.
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default_serializer(obj):
+    """Serialize objects orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def _json_cell(value) -> str:
+    """Encode a nested CSV cell value as a JSON string, formatted as ``json.dumps`` does."""
+    return json.dumps(value, default=_default_serializer)
+
 
 def save_to_json(data: BaseModel | Sequence[BaseModel] | dict | list, filename: str | Path) -> None:
     """Save data to a JSON file.
 
+    Models and model lists are serialized natively by pydantic-core (see
+    ``transform.models_to_json``); other data goes through orjson. The encoded bytes are written directly.
+
     Args:
         data: A Pydantic model, a list of models, or a dict/list.
         filename: The output filename.
@@ -21,24 +43,19 @@ def save_to_json(data: BaseModel | Sequence[BaseModel] | dict | list, filename:
     path = Path(filename)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    def default_serializer(obj):
-        if isinstance(obj, BaseModel):
-            return obj.model_dump()
-        raise TypeError(f"Type {type(obj)} not serializable")
-
-    with open(path, "w", encoding="utf-8") as f:
-        if isinstance(data, BaseModel):
-            json.dump(data.model_dump(), f, indent=2, default=default_serializer)
-        elif isinstance(data, (list, tuple)) and data and isinstance(data[0], BaseModel):
-            json.dump([item.model_dump() for item in data], f, indent=2, default=default_serializer)
-        else:
-            json.dump(data, f, indent=2, default=default_serializer)
+    if isinstance(data, BaseModel):
+        path.write_bytes(data.model_dump_json(indent=2).encode("utf-8"))
+        return
+    if isinstance(data, (list, tuple)) and data and isinstance(data[0], BaseModel):
+        path.write_bytes(models_to_json(data, indent=2))
+        return
+    path.write_bytes(orjson.dumps(data, default=_default_serializer, option=_ORJSON_OPTIONS))
 
 
 def save_to_csv(data: Sequence[BaseModel] | Sequence[dict], filename: str | Path) -> None:
     """Save a list of data items to a CSV file.
 
-    Flattens nested dictionaries/lists into string representations for CSV compatibility.
+    Flattens nested dictionaries/lists into JSON strings for CSV compatibility.
 
     Args:
         data: A list of Pydantic models or dictionaries.
@@ -61,18 +78,13 @@ def save_to_csv(data: Sequence[BaseModel] | Sequence[dict], filename: str | Path
     if not rows:
         return
 
-    # Determine headers from the first item
-    headers = list(rows[0].keys())
-
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for row in rows:
-            # Simple flattening: convert complex types to JSON strings or repr
-            clean_row = {}
-            for k, v in row.items():
-                if isinstance(v, (dict, list, tuple)):
-                    clean_row[k] = json.dumps(v)
-                else:
-                    clean_row[k] = v
-            writer.writerow(clean_row)
+    # Headers come from the first item; nested dicts/lists are flattened to JSON strings
+    # for CSV compatibility, one pass per column. Columns stay object dtype so optional
+    # ints are written as 321 rather than upcast to 321.0 when another row has None.
+    df = pd.DataFrame(rows, columns=list(rows[0].keys()), dtype=object)
+    for col in df.columns:
+        mask = df[col].map(lambda v: isinstance(v, (dict, list, tuple)))
+        if mask.any():
+            df[col] = df[col].where(~mask, df.loc[mask, col].map(_json_cell))
+    # Same line endings as the csv.DictWriter output this replaced.
+    write_csv_sink(df, path.as_posix(), lineterminator="\r\n")
@@ -0,0 +1,40 @@
+"""Tests for the on-disk response cache."""
+
+import os
+import time
+
+from bgg_extractor.cache import ResponseCache
+
+
+def test_cache_roundtrip(tmp_path):
+    """Test that a stored response is returned for the same path and params."""
+    cache = ResponseCache(tmp_path)
+    cache.set("thing", {"id": "1", "stats": 1}, "<items/>")
+
+    assert cache.get("thing", {"stats": 1, "id": "1"}) == "<items/>"
+    assert cache.get("thing", {"id": "2", "stats": 1}) is None
+    assert cache.get("family", {"id": "1", "stats": 1}) is None
+
+
+def test_cache_expiry(tmp_path):
+    """Test that responses older than the TTL are ignored."""
+    cache = ResponseCache(tmp_path, ttl=60)
+    params = {"query": "catan"}
+    cache.set("search", params, "<items/>")
+
+    cache_file = next(tmp_path.glob("*.xml"))
+    old = time.time() - 120
+    os.utime(cache_file, (old, old))
+
+    assert cache.get("search", params) is None
+
+
+def test_cache_bytes_roundtrip(tmp_path):
+    """Test that raw response bytes are stored as-is and readable as bytes or text."""
+    cache = ResponseCache(tmp_path)
+    body = '<?xml version="1.0" encoding="utf-8"?><items><name value="Café"/></items>'.encode()
+    cache.set("thing", {"id": "1"}, body)
+
+    assert cache.get_bytes("thing", {"id": "1"}) == body
+    assert cache.get("thing", {"id": "1"}) == body.decode("utf-8")
+    assert cache.get_bytes("thing", {"id": "2"}) is None
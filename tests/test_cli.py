@@ -0,0 +1,71 @@
+"""Tests for CLI configuration loading."""
+
+import json
+import os
+
+import pytest
+
+from bgg_extractor import cli
+from bgg_extractor.cli import load_config
+
+
+def test_load_config_yaml(tmp_path):
+    """Test loading a YAML config file."""
+    path = tmp_path / "config.yml"
+    path.write_text("extractor: things\nthings: [1, 2]\n", encoding="utf-8")
+
+    assert load_config(str(path)) == {"extractor": "things", "things": [1, 2]}
+
+
+def test_load_config_json(tmp_path):
+    """Test loading a JSON config file."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"extractor": "user", "user": "someone"}), encoding="utf-8")
+
+    assert load_config(str(path)) == {"extractor": "user", "user": "someone"}
+
+
+def test_load_config_reloads_after_modification(tmp_path):
+    """Test that a cached config is re-read once the file's mtime changes."""
+    path = tmp_path / "config.yml"
+    path.write_text("extractor: things\n", encoding="utf-8")
+    first = load_config(str(path))
+    first["extractor"] = "mutated"
+
+    assert load_config(str(path)) == {"extractor": "things"}
+
+    path.write_text("extractor: user\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_config(str(path)) == {"extractor": "user"}
+
+
+@pytest.mark.parametrize(
+    ("argv", "cfg", "expected"),
+    [(["--cache", "--cache-ttl", "0"], {"cache_ttl": 600}, 0), (["--cache"], {"cache_ttl": 600}, 600)],
+)
+def test_cache_ttl_zero_is_respected(mocker, argv, cfg, expected):
+    """Test that an explicit --cache-ttl 0 is used instead of falling back to the config."""
+    cache_cls = mocker.patch.object(cli, "ResponseCache")
+    mocker.patch.object(cli, "set_default_cache")
+    args = cli.build_parser().parse_args(argv)
+
+    with pytest.raises(SystemExit):
+        cli.run_extraction(args, cfg)  # no extractor given, so it exits after configuring the cache
+
+    cache_cls.assert_called_once_with(ttl=expected)
+
+
+@pytest.mark.parametrize(("argv", "cfg"), [([], {}), (["--cache-ttl", "60"], {})])
+def test_cache_is_opt_in(mocker, argv, cfg):
+    """Test that no response cache is configured unless --cache (or config 'cache') is given."""
+    cache_cls = mocker.patch.object(cli, "ResponseCache")
+    set_cache = mocker.patch.object(cli, "set_default_cache")
+    args = cli.build_parser().parse_args(argv)
+
+    with pytest.raises(SystemExit):
+        cli.run_extraction(args, cfg)
+
+    cache_cls.assert_not_called()
+    set_cache.assert_called_once_with(None)
@@ -1,9 +1,18 @@
 """Unit tests for BGGClient."""
 
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+
+import httpx
 import pytest
 import respx
 from httpx import Response
 
+from bgg_extractor import client as client_module
+from bgg_extractor.cache import ResponseCache
 from bgg_extractor.client import BGGClient
 from bgg_extractor.schemas import ThingSchema, UserSchema
 
@@ -97,3 +106,250 @@ async def test_max_retries_exceeded():
         async with BGGClient(min_delay=0.01, max_poll_attempts=2) as client:
             with pytest.raises(RuntimeError, match="BGG queued too long"):
                 await client.get_thing([1])
+
+
+@pytest.mark.asyncio
+async def test_get_things_batched_splits_ids():
+    """Test that get_things_batched issues one request per batch and merges the items."""
+
+    def respond(request):
+        ids = request.url.params["id"].split(",")
+        items = "".join(f'<item type="boardgame" id="{i}"><name value="Game {i}"/></item>' for i in ids)
+        return Response(200, text=f"<items>{items}</items>")
+
+    async with respx.mock:
+        route = respx.get(url__startswith="https://api.geekdo.com/xmlapi2/thing").mock(side_effect=respond)
+
+        async with BGGClient(min_delay=0.0) as client:
+            things = await client.get_things_batched(list(range(1, 46)))
+            assert route.call_count == 3
+            assert [item.id for item in things.items] == list(range(1, 46))
+
+
+@pytest.mark.asyncio
+async def test_client_without_context_manager_reuses_pool():
+    """Test that a client used outside `async with` keeps one pooled HTTP client until aclose()."""
+    xml_response = """<items><item id="1"><name value="Game"/></item></items>"""
+
+    async with respx.mock:
+        respx.get(url__startswith="https://api.geekdo.com/xmlapi2/thing").mock(
+            return_value=Response(200, text=xml_response)
+        )
+
+        client = BGGClient(min_delay=0.0)
+        await client.get_thing([1])
+        http_client = client._client
+        await client.get_thing([1])
+        assert http_client is not None
+        assert client._client is http_client
+
+        await client.aclose()
+        assert client._client is None
+        assert http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_cached_response_skips_network(tmp_path):
+    """Test that a cached response is served without a second request."""
+    xml_response = """<items><item id="1"><name value="Game"/></item></items>"""
+
+    async with respx.mock:
+        route = respx.get(url__startswith="https://api.geekdo.com/xmlapi2/thing").mock(
+            return_value=Response(200, text=xml_response)
+        )
+
+        async with BGGClient(min_delay=0.0, cache=ResponseCache(tmp_path)) as client:
+            first = await client.get_thing([1])
+            second = await client.get_thing([1])
+            assert route.call_count == 1
+            assert first == second
+
+
+@pytest.mark.asyncio
+async def test_get_collection_stream_matches_buffered():
+    """Test that the streaming parse yields the same collection as the buffered parse."""
+    xml_response = """<?xml version="1.0" encoding="utf-8"?>
+    <items totalitems="2">
+        <item objectid="1" subtype="boardgame" collid="10">
+            <name sortindex="1">Die Macher</name>
+            <stats rating="8.0"/>
+        </item>
+        <item objectid="2" subtype="boardgame" collid="11">
+            <name sortindex="1">Dragonmaster</name>
+        </item>
+    </items>
+    """
+    async with respx.mock:
+        respx.get(url__startswith="https://api.geekdo.com/xmlapi2/collection").mock(
+            return_value=Response(200, text=xml_response)
+        )
+
+        async with BGGClient(min_delay=0.0) as client:
+            streamed = await client.get_collection("user", stream=True)
+            buffered = await client.get_collection("user")
+            assert [item.name for item in streamed.items] == ["Die Macher", "Dragonmaster"]
+            assert streamed == buffered
+
+
+def test_retry_delay_honors_retry_after():
+    """Test that 202 polling delays follow Retry-After and fall back to exponential backoff."""
+    client = BGGClient(min_delay=2.0)
+
+    assert client._retry_delay(Response(202, headers={"Retry-After": "5"}), attempts=1) == 5.0
+    assert client._retry_delay(Response(202, headers={"Retry-After": "9999"}), attempts=1) == 120.0
+    assert client._retry_delay(Response(202, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}), 1) == 0.0
+    assert client._retry_delay(Response(202), attempts=3) == 4.5
+
+
+@pytest.mark.asyncio
+async def test_throttle_spaces_concurrent_requests():
+    """Test that concurrent callers are given distinct, evenly spaced start slots."""
+    client = BGGClient(min_delay=0.05)
+    loop = asyncio.get_running_loop()
+    starts: list[float] = []
+
+    async def record():
+        await client._throttle()
+        starts.append(loop.time())
+
+    await asyncio.gather(*(record() for _ in range(3)))
+    starts.sort()
+    assert starts[1] - starts[0] >= 0.045
+    assert starts[2] - starts[1] >= 0.045
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_thing_sends_only_enabled_flags():
+    """Test that get_thing sends enabled boolean flags as 1 and omits disabled ones."""
+    route = respx.get("https://api.geekdo.com/xmlapi2/thing").mock(
+        return_value=Response(200, text='<items termsofuse=""></items>')
+    )
+    async with BGGClient() as client:
+        await client.get_thing([1], stats=False, videos=True, ratingcomments=True)
+
+    params = route.calls.last.request.url.params
+    assert params["videos"] == "1"
+    assert params["ratingcomments"] == "1"
+    assert "stats" not in params
+    assert "versions" not in params
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_iter_plays_follows_pages():
+    """Test that iter_plays yields every play across pages and stops on a short page."""
+    full_page = "".join(f'<play id="{i}" date="2024-01-01" quantity="1" length="0"/>' for i in range(100))
+    route = respx.get("https://api.geekdo.com/xmlapi2/plays").mock(
+        side_effect=[
+            Response(200, text=f'<plays username="u" page="1">{full_page}</plays>'),
+            Response(200, text='<plays username="u" page="2"><play id="100" date="2024-01-02"/></plays>'),
+        ]
+    )
+    async with BGGClient(min_delay=0) as client:
+        plays = [play async for play in client.iter_plays(username="u")]
+
+    assert len(plays) == 101
+    assert plays[-1].id == 100
+    assert [call.request.url.params["page"] for call in route.calls] == ["1", "2"]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_requests_advertise_compressed_encodings():
+    """Test that requests accept brotli and zstd compressed responses."""
+    route = respx.get("https://api.geekdo.com/xmlapi2/search").mock(
+        return_value=Response(200, text='<items total="0" termsofuse=""></items>')
+    )
+    async with BGGClient() as client:
+        await client.search("Catan")
+
+    accept = route.calls.last.request.headers["Accept-Encoding"]
+    assert "gzip" in accept
+    assert "br" in accept
+    assert "zstd" in accept
+
+
+def _large_thing_xml(count: int = 2000) -> str:
+    items = "".join(
+        f'<item type="boardgame" id="{i}"><name type="primary" value="Game {i}"/></item>' for i in range(1, count + 1)
+    )
+    return f'<items termsofuse="">{items}</items>'
+
+
+@pytest.mark.asyncio
+@respx.mock
+@pytest.mark.parametrize("parse_processes", [False, True])
+async def test_large_response_parsed_off_loop(parse_processes):
+    """Test that responses above the inline threshold parse correctly in a thread or worker process."""
+    xml = _large_thing_xml()
+    assert len(xml) >= client_module._POOL_MIN_CHARS
+    respx.get("https://api.geekdo.com/xmlapi2/thing").mock(return_value=Response(200, text=xml))
+
+    async with BGGClient(parse_processes=parse_processes) as client:
+        result = await client.get_thing(list(range(1, 2001)))
+
+    assert len(result.items) == 2000
+    assert result.items[-1].name == "Game 2000"
+
+
+def test_unguarded_script_parses_large_response(tmp_path):
+    """Test that a script without a __main__ guard can fetch a large response with the defaults."""
+    script = tmp_path / "unguarded.py"
+    script.write_text(
+        textwrap.dedent(
+            f"""
+            import respx
+            from httpx import Response
+            from bgg_extractor import get_things
+
+            print("start")
+            with respx.mock:
+                respx.get(url__startswith="https://api.geekdo.com/xmlapi2/thing").mock(
+                    return_value=Response(200, text={_large_thing_xml()!r})
+                )
+                games = get_things([1], stats=True)
+            print(len(games.items))
+            """
+        ),
+        encoding="utf-8",
+    )
+    src_dir = os.path.dirname(os.path.dirname(client_module.__file__))
+    env = {**os.environ, "BGG_API_TOKEN": "test-token", "PYTHONPATH": src_dir}
+
+    result = subprocess.run(  # noqa: S603 - runs the test's own script with this interpreter
+        [sys.executable, str(script)], capture_output=True, text=True, env=env, timeout=60
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["start", "2000"]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_transient_failures_are_retried():
+    """Test that 5xx responses and network errors are retried before succeeding."""
+    route = respx.get("https://api.geekdo.com/xmlapi2/search").mock(
+        side_effect=[
+            Response(503, text="Service Unavailable"),
+            httpx.ConnectError("connection refused"),
+            Response(200, text='<items total="0" termsofuse=""></items>'),
+        ]
+    )
+    async with BGGClient(min_delay=0) as client:
+        result = await client.search("Catan")
+
+    assert result.items == []
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_persistent_server_error_raises_after_retries():
+    """Test that a server error is raised once MAX_RETRIES is exhausted."""
+    route = respx.get("https://api.geekdo.com/xmlapi2/search").mock(return_value=Response(500, text="boom"))
+    async with BGGClient(min_delay=0) as client:
+        with pytest.raises(RuntimeError, match="500"):
+            await client.search("Catan")
+
+    assert route.call_count == BGGClient.MAX_RETRIES + 1
@@ -0,0 +1,28 @@
+"""Unit tests for the synchronous demo client."""
+
+import pytest
+import requests
+
+from bgg_extractor.client_demo import MAX_BACKOFF_SECONDS, BGGClient
+
+
+def _response(retry_after: str) -> requests.Response:
+    resp = requests.Response()
+    resp.headers["Retry-After"] = retry_after
+    return resp
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected"),
+    [("5", 5.0), ("99999", MAX_BACKOFF_SECONDS), ("inf", MAX_BACKOFF_SECONDS), ("-3", 0.0)],
+)
+def test_retry_delay_clamps_retry_after(retry_after, expected):
+    """Test that Retry-After is honored but never exceeds the backoff ceiling."""
+    client = BGGClient(min_delay=1.0)
+    assert client._retry_delay(_response(retry_after), attempts=1) == expected
+
+
+def test_retry_delay_ignores_nan_retry_after():
+    """Test that an unusable Retry-After falls back to jittered backoff."""
+    client = BGGClient(min_delay=1.0)
+    assert 1.0 <= client._retry_delay(_response("nan"), attempts=1) <= 2.0
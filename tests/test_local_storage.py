@@ -3,6 +3,8 @@ import shutil
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from bgg_extractor.storage.local import LocalStorage
@@ -93,3 +95,186 @@ def test_write_dataframe_ndjson(temp_dir):
         lines = f.readlines()
     assert len(lines) == 2
     assert json.loads(lines[0]) == {"a": 1, "b": "x"}
+
+
+def test_write_dataframe_ndjson_missing_values(temp_dir):
+    storage = LocalStorage(base_path=str(temp_dir))
+    df = pd.DataFrame({"a": [1.5, None], "b": ["x", None]})
+
+    out_path = storage.write_dataframe("test.ndjson", df, fmt="json", ndjson=True)
+
+    with open(out_path) as f:
+        rows = [json.loads(line) for line in f]
+    assert rows == [{"a": 1.5, "b": "x"}, {"a": None, "b": None}]
+
+
+def test_write_json_ascii_and_unicode(temp_dir):
+    storage = LocalStorage(base_path=str(temp_dir))
+    data = {"name": "Café", 1: "one"}
+
+    utf8_path = storage.write_json("utf8.json", data)
+    ascii_path = storage.write_json("ascii.json", data, ensure_ascii=True)
+
+    assert "Café" in Path(utf8_path).read_text(encoding="utf-8")
+    assert "Caf\\u00e9" in Path(ascii_path).read_text(encoding="utf-8")
+    with open(utf8_path, encoding="utf-8") as f:
+        assert json.load(f) == {"name": "Café", "1": "one"}
+
+
+def test_normalize_dataframe_columns_matches_scalar_rules():
+    from bgg_extractor.storage.utils import normalize_column_name, normalize_dataframe_columns
+
+    columns = ["Café Name", "  __A--b  ", "", "!!!", 5, "MixedCase", "Keep Me"]
+    df = pd.DataFrame([range(len(columns))], columns=columns)
+
+    out = normalize_dataframe_columns(df, rename_map={"Keep Me": "Kept"})
+
+    assert list(out.columns) == [*(normalize_column_name(c) for c in columns[:-1]), "Kept"]
+
+
+def test_coerce_dataframe_types_detects_date_columns():
+    from bgg_extractor.storage.utils import coerce_dataframe_types
+
+    df = pd.DataFrame({
+        "when": pd.Series(["2024-01-01", "2024-02-03", None], dtype=object),
+        "name": pd.Series(["Catan", "Azul", "Brass"], dtype=object),
+    })
+
+    out = coerce_dataframe_types(df)
+
+    assert str(out["when"].dtype).startswith("datetime64")
+    assert out["name"].dtype == object
+
+
+def test_write_dataframe_parquet_in_row_groups(temp_dir):
+    storage = LocalStorage(base_path=str(temp_dir))
+    df = pd.DataFrame({"a": range(10), "b": [None] * 5 + ["x"] * 5})
+
+    out_path = storage.write_dataframe("chunked.parquet", df, fmt="parquet", row_group_size=4)
+
+    assert pq.ParquetFile(out_path).metadata.num_row_groups == 3
+    pd.testing.assert_frame_equal(pd.read_parquet(out_path), df)
+
+
+def test_coerce_dataframe_types_with_schema():
+    from bgg_extractor.storage.utils import coerce_dataframe_types
+
+    df = pd.DataFrame({"extra": ["x", "y"], "rating": ["7.5", "bad"], "id": ["1", "2"]})
+    out = coerce_dataframe_types(df, {"id": "int64", "rating": "float64", "missing": "float64"})
+
+    assert list(out.columns) == ["id", "rating", "missing", "extra"]
+    assert out["id"].tolist() == [1, 2]
+    assert out["rating"].iloc[0] == 7.5 and pd.isna(out["rating"].iloc[1])
+    assert out["missing"].isna().all()
+    assert list(df.columns) == ["extra", "rating", "id"]
+
+
+def test_write_bytes_large_and_overwrite(temp_dir):
+    storage = LocalStorage(base_path=str(temp_dir))
+    big = bytes(range(256)) * 5000  # spans several 1 MiB write chunks
+
+    out_path = Path(storage.write_bytes("blob.bin", big))
+    assert out_path.read_bytes() == big
+
+    storage.write_bytes("blob.bin", b"short")
+    assert out_path.read_bytes() == b"short"
+    assert not out_path.with_suffix(".bin.tmp").exists()
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "csv", "json"])
+def test_write_dataframe_accepts_arrow_table(temp_dir, fmt):
+    storage = LocalStorage(base_path=str(temp_dir))
+    table = pa.table({"Game Id": [1, 2], "name": ["a", "b"]})
+
+    out = storage.write_dataframe(f"t.{fmt}", table, fmt=fmt)
+
+    if fmt == "parquet":
+        assert pd.read_parquet(out).to_dict(orient="list") == {"Game Id": [1, 2], "name": ["a", "b"]}
+    elif fmt == "csv":
+        assert pd.read_csv(out).to_dict(orient="list") == {"Game Id": [1, 2], "name": ["a", "b"]}
+    else:
+        assert json.loads(Path(out).read_text()) == [{"Game Id": 1, "name": "a"}, {"Game Id": 2, "name": "b"}]
+
+
+def test_write_many(temp_dir):
+    storage = LocalStorage(base_path=str(temp_dir))
+    df = pd.DataFrame({"id": [1, 2]})
+
+    out = storage.write_many([("a.bin", b"raw"), ("b.json", {"k": 1}), ("c.csv", df), ("d/e.parquet", df)])
+
+    assert [Path(p).name for p in out] == ["a.bin", "b.json", "c.csv", "e.parquet"]
+    assert Path(out[0]).read_bytes() == b"raw"
+    assert json.loads(Path(out[1]).read_text()) == {"k": 1}
+    assert pd.read_csv(out[2])["id"].tolist() == [1, 2]
+    assert pd.read_parquet(out[3])["id"].tolist() == [1, 2]
+    assert storage.write_many([]) == []
+
+
+def test_write_dataframe_json_records(temp_dir):
+    storage = LocalStorage(base_path=str(temp_dir))
+    df = pd.DataFrame({"id": [1, 2], "score": [7.5, None], "mixed": [1, "x"]})
+
+    out = storage.write_dataframe("rows.json", df, fmt="json")
+
+    assert json.loads(Path(out).read_text()) == [
+        {"id": 1, "score": 7.5, "mixed": 1},
+        {"id": 2, "score": None, "mixed": "x"},
+    ]
+    out = storage.write_dataframe("rows.json", df[["id", "score"]], fmt="json")
+    assert json.loads(Path(out).read_text()) == [{"id": 1, "score": 7.5}, {"id": 2, "score": None}]
+
+
+def test_normalize_columns_already_normalized():
+    from bgg_extractor.storage.utils import _is_normalized, normalize_column_name, normalize_dataframe_columns
+
+    labels = ["game_id", "name2", "_id", "id_", "a__b", "café", "Name", "x-y", 3, "col"]
+    for label in labels:
+        assert _is_normalized(label) == (label == normalize_column_name(label))
+
+    df = pd.DataFrame([[1, 2]], columns=["game_id", "name"])
+    assert normalize_dataframe_columns(df).columns.equals(df.columns)
+    assert list(normalize_dataframe_columns(df, rename_map={"name": "title"}).columns) == ["game_id", "title"]
+
+
+def test_write_dataframe_csv_format(temp_dir):
+    """Test that CSV quoting is the same for every dtype mix and for DataFrame or Arrow input."""
+    storage = LocalStorage(temp_dir)
+    strings = pd.DataFrame({"id": [1, 2], "name": ["a", "b,c"]})
+    mixed = pd.DataFrame({
+        "rating": [8.0, 7.5],
+        "owned": [True, False],
+        "date": pd.to_datetime(["2020-01-01", "2021-06-30"]),
+    })
+
+    out = storage.write_dataframe("strings.csv", strings, fmt="csv")
+    assert Path(out).read_text(encoding="utf-8") == 'id,name\n1,a\n2,"b,c"\n'
+    out = storage.write_dataframe("strings_table.csv", pa.Table.from_pandas(strings), fmt="csv")
+    assert Path(out).read_text(encoding="utf-8") == 'id,name\n1,a\n2,"b,c"\n'
+
+    out = storage.write_dataframe("mixed.csv", mixed, fmt="csv")
+    assert Path(out).read_text(encoding="utf-8") == ("rating,owned,date\n8.0,True,2020-01-01\n7.5,False,2021-06-30\n")
+    table_out = storage.write_dataframe("mixed_table.csv", pa.Table.from_pandas(mixed), fmt="csv")
+    assert Path(table_out).read_bytes() == Path(out).read_bytes()
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+def test_write_dataframe_json_datetime_format(temp_dir, ndjson):
+    """Test that timestamps keep the str() form used before orjson was adopted."""
+    storage = LocalStorage(temp_dir)
+    df = pd.DataFrame({"date": pd.to_datetime(["2020-01-01"], utc=True)})
+
+    out = storage.write_dataframe("dates.json", df, fmt="json", ndjson=ndjson)
+
+    text = Path(out).read_text(encoding="utf-8")
+    record = json.loads(text.splitlines()[0]) if ndjson else json.loads(text)[0]
+    assert record == {"date": "2020-01-01 00:00:00+00:00"}
+
+
+def test_write_dataframe_arrow_table_csv_forwards_kwargs(temp_dir):
+    """Test that to_csv options reach the writer for Arrow table input too."""
+    storage = LocalStorage(temp_dir)
+    table = pa.table({"id": [1, 2], "name": ["a", "b"]})
+
+    out = storage.write_dataframe("t.csv", table, fmt="csv", sep=";")
+
+    assert Path(out).read_text(encoding="utf-8") == "id;name\n1;a\n2;b\n"
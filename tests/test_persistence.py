@@ -1,5 +1,7 @@
 """Tests for persistence module."""
 
+import csv
+import json
 import tempfile
 from pathlib import Path
 
@@ -20,8 +22,6 @@ def test_save_json():
 
         assert output_path.exists()
         # Verify content
-        import json
-
         with open(output_path) as f:
             data = json.load(f)
         assert len(data) == 2
@@ -41,10 +41,69 @@ def test_save_csv():
 
         assert output_path.exists()
         # Verify content
-        import csv
-
         with open(output_path) as f:
             reader = csv.DictReader(f)
             rows = list(reader)
         assert len(rows) == 2
         assert rows[0]["id"] == "1"
+
+
+def test_save_json_nested_models_and_int_keys():
+    """Test saving a dict holding models and non-string keys to JSON."""
+    data = {"things": [ThingItem(id=1, name="Game1")], 2024: "year"}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_path = Path(tmpdir) / "test.json"
+        save_json(data, output_path)
+
+        with open(output_path) as f:
+            loaded = json.load(f)
+        assert loaded["things"][0]["name"] == "Game1"
+        assert loaded["2024"] == "year"
+
+
+def test_save_csv_flattens_nested_values():
+    """Test that nested lists/dicts are written as JSON strings and missing values as empty cells."""
+    rows = [{"id": 1, "tags": ["a", "b"], "meta": {"k": 1}}, {"id": 2, "tags": None, "meta": {"k": 2}}]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_path = Path(tmpdir) / "test.csv"
+        save_csv(rows, output_path)
+
+        with open(output_path, encoding="utf-8") as f:
+            out = list(csv.DictReader(f))
+    assert [r["id"] for r in out] == ["1", "2"]
+    assert json.loads(out[0]["tags"]) == ["a", "b"]
+    assert out[1]["tags"] == ""
+    assert json.loads(out[1]["meta"]) == {"k": 2}
+
+
+def test_save_json_models_match_model_dump():
+    """Test that single models and model lists are written as their JSON-mode dumps."""
+    items = [ThingItem(id=1, name="Café"), ThingItem(id=2, name="Game2", yearpublished=2020)]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        list_path = Path(tmpdir) / "list.json"
+        single_path = Path(tmpdir) / "single.json"
+        save_json(items, list_path)
+        save_json(items[0], single_path)
+
+        assert json.loads(list_path.read_text(encoding="utf-8")) == [i.model_dump(mode="json") for i in items]
+        assert json.loads(single_path.read_text(encoding="utf-8")) == items[0].model_dump(mode="json")
+
+
+def test_save_csv_exact_output_with_missing_int():
+    """Test that optional ints stay integers and nested cells keep json.dumps formatting."""
+    items = [
+        ThingItem(id=1, name="Die Macher", yearpublished=1986, rank=321, average=8.0, categories=["Économie", "x"]),
+        ThingItem(id=2, name="Unranked"),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_path = Path(tmpdir) / "test.csv"
+        save_csv(items, output_path)
+        lines = output_path.read_bytes().decode("utf-8").split("\r\n")
+
+    assert lines[0].split(",")[:5] == ["id", "type", "name", "description", "yearpublished"]
+    assert lines[1] == '1,,Die Macher,,1986,,,,,,8.0,321,"[""\\u00c9conomie"", ""x""]",[],[],[],[]'
+    assert lines[2] == "2,,Unranked,,,,,,,,,,[],[],[],[],[]"
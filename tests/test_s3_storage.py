@@ -1,10 +1,21 @@
+import io
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pytest
 
+from bgg_extractor.storage import s3 as s3_module
 from bgg_extractor.storage.s3 import S3Storage
 
 
+@pytest.fixture(autouse=True)
+def clear_s3_client_cache():
+    """Drop the shared S3 client so each test sees its own patched boto3.client."""
+    s3_module._default_s3_client.cache_clear()
+    yield
+    s3_module._default_s3_client.cache_clear()
+
+
 def test_s3_write_dataframe_parquet(monkeypatch):
     df = pd.DataFrame([{"id": 1, "name": "a"}])
     mock_client = MagicMock()
@@ -13,3 +24,66 @@ def test_s3_write_dataframe_parquet(monkeypatch):
         s3 = S3Storage(bucket="my-bucket", prefix="pfx")
         res = s3.write_dataframe("test/out.parquet", df, fmt="parquet")
         assert res.startswith("s3://my-bucket/pfx/test/out.parquet")
+
+
+def test_s3_storages_share_default_client():
+    mock_client = MagicMock()
+    with patch("bgg_extractor.storage.s3.boto3.client", return_value=mock_client) as client_factory:
+        first = S3Storage(bucket="a")
+        second = S3Storage(bucket="b", prefix="p")
+    assert first.s3 is second.s3 is mock_client
+    assert client_factory.call_count == 1
+    assert client_factory.call_args.kwargs["config"] is s3_module._S3_CONFIG
+
+
+def test_s3_write_bytes_uses_multipart_for_large_bodies():
+    mock_client = MagicMock()
+    with patch("bgg_extractor.storage.s3.boto3.client", return_value=mock_client):
+        s3 = S3Storage(bucket="my-bucket")
+        s3.write_bytes("small.bin", b"x")
+        s3.write_bytes("large.bin", b"x" * s3_module._MULTIPART_THRESHOLD)
+
+    mock_client.put_object.assert_called_once()
+    assert mock_client.put_object.call_args.kwargs["Key"] == "small.bin"
+    mock_client.upload_fileobj.assert_called_once()
+    assert mock_client.upload_fileobj.call_args.args[1:] == ("my-bucket", "large.bin")
+
+
+def test_s3_write_dataframe_parquet_streams_row_groups():
+    import pyarrow.parquet as pq
+
+    df = pd.DataFrame({"id": range(10), "name": list("abcdefghij")})
+    uploaded = {}
+    mock_client = MagicMock()
+    mock_client.upload_fileobj.side_effect = lambda f, bucket, key, **kw: uploaded.update(body=f.read())
+    with patch("bgg_extractor.storage.s3.boto3.client", return_value=mock_client):
+        S3Storage(bucket="my-bucket").write_dataframe("out.parquet", df, row_group_size=4)
+
+    mock_client.put_object.assert_not_called()
+    parquet = pq.ParquetFile(io.BytesIO(uploaded["body"]))
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().to_pandas().equals(df)
+
+
+@pytest.mark.parametrize("df", [pd.DataFrame({"id": [1, 2], "name": ["a", "é"]}), pd.DataFrame({"v": [1, "x"]})])
+def test_s3_write_dataframe_csv_uploads_encoded_file(df):
+    uploaded = {}
+    mock_client = MagicMock()
+    mock_client.upload_fileobj.side_effect = lambda f, bucket, key, **kw: uploaded.update(body=f.read())
+    with patch("bgg_extractor.storage.s3.boto3.client", return_value=mock_client):
+        S3Storage(bucket="my-bucket").write_dataframe("out.csv", df, fmt="csv")
+
+    assert pd.read_csv(io.BytesIO(uploaded["body"]), dtype=str).equals(df.astype(str))
+
+
+def test_s3_write_dataframe_parquet_uses_zstd():
+    import pyarrow.parquet as pq
+
+    uploaded = {}
+    mock_client = MagicMock()
+    mock_client.upload_fileobj.side_effect = lambda f, bucket, key, **kw: uploaded.update(body=f.read())
+    with patch("bgg_extractor.storage.s3.boto3.client", return_value=mock_client):
+        S3Storage(bucket="my-bucket").write_dataframe("out.parquet", pd.DataFrame({"id": [1, 2]}))
+
+    column = pq.ParquetFile(io.BytesIO(uploaded["body"])).metadata.row_group(0).column(0)
+    assert column.compression == "ZSTD"
@@ -1,22 +1,27 @@
 """Unit tests for schemas and XML parsing."""
 
-from bgg_extractor.schemas import CollectionSchema, PlaysSchema, ThingSchema, UserSchema
+import io
+from pathlib import Path
+
+import pytest
+
+from bgg_extractor.schemas import CollectionSchema, FamilySchema, PlayItem, PlaysSchema, ThingSchema, UserSchema
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+_USER_XML = b"""
+<user id="123" name="testuser">
+    <firstname value="Test"/>
+    <lastname value="User"/>
+    <avatar value="http://example.com/avatar.jpg"/>
+    <yearregistered value="2020"/>
+</user>
+"""
 
 
 def test_parse_thing_xml():
     """Test parsing of a Thing XML."""
-    xml = """
-    <items>
-        <item type="boardgame" id="1">
-            <name value="Die Macher"/>
-            <yearpublished value="1986"/>
-            <statistics>
-                <ratings usersrated="5000" average="7.6"/>
-            </statistics>
-        </item>
-    </items>
-    """
-    schema = ThingSchema.parse_xml(xml)
+    schema = ThingSchema.parse_xml_file(FIXTURES / "thing_die_macher.xml")
     assert len(schema.items) == 1
     item = schema.items[0]
     assert item.id == 1
@@ -28,15 +33,7 @@ def test_parse_thing_xml():
 
 def test_parse_user_xml():
     """Test parsing of a User XML."""
-    xml = """
-    <user id="123" name="testuser">
-        <firstname value="Test"/>
-        <lastname value="User"/>
-        <avatar value="http://example.com/avatar.jpg"/>
-        <yearregistered value="2020"/>
-    </user>
-    """
-    schema = UserSchema.parse_xml(xml)
+    schema = UserSchema.parse_xml(_USER_XML)
     assert schema.id == 123
     assert schema.name == "testuser"
     assert schema.firstname == "Test"
@@ -45,15 +42,7 @@ def test_parse_user_xml():
 
 def test_parse_collection_xml():
     """Test parsing of a Collection XML."""
-    xml = """
-    <items>
-        <item objectid="1" subtype="boardgame" collid="10">
-            <name value="Die Macher"/>
-            <stats rating="8.0"/>
-        </item>
-    </items>
-    """
-    schema = CollectionSchema.parse_xml(xml)
+    schema = CollectionSchema.parse_xml_file(FIXTURES / "collection_die_macher.xml")
     assert len(schema.items) == 1
     item = schema.items[0]
     assert item.objectid == 1
@@ -63,14 +52,7 @@ def test_parse_collection_xml():
 
 def test_parse_plays_xml():
     """Test parsing of a Plays XML."""
-    xml = """
-    <plays>
-        <play id="100" date="2023-01-01" quantity="1" length="60">
-            <item name="Die Macher" objectid="1"/>
-        </play>
-    </plays>
-    """
-    schema = PlaysSchema.parse_xml(xml)
+    schema = PlaysSchema.parse_xml_file(FIXTURES / "plays_die_macher.xml")
     assert len(schema.plays) == 1
     play = schema.plays[0]
     assert play.id == 100
@@ -79,3 +61,144 @@ def test_parse_plays_xml():
     assert play.length == 60
     assert play.item is not None  # Type narrowing for type checker
     assert play.item["name"] == "Die Macher"
+    assert play.item.objectid == 1
+
+
+def test_parse_thing_xml_ignores_nested_version_items():
+    """Test that nested version <item> elements are not parsed as top-level things."""
+    xml = """
+    <items>
+        <item type="boardgame" id="1">
+            <name value="Die Macher"/>
+            <versions>
+                <item type="boardgameversion" id="900"><name value="First edition"/></item>
+            </versions>
+        </item>
+        <item type="boardgame" id="2"><name value="Dragonmaster"/></item>
+    </items>
+    """
+    schema = ThingSchema.parse_xml(xml)
+    assert [item.id for item in schema.items] == [1, 2]
+    assert schema.items[0].name == "Die Macher"
+
+
+def test_parse_thing_xml_links_and_primary_name():
+    """Test that links are grouped by type and the first <name> is used as the primary name."""
+    xml = """
+    <items>
+        <item type="boardgame" id="1">
+            <name type="primary" value="Die Macher"/>
+            <name type="alternate" value="Los Hacedores"/>
+            <description>Election game.</description>
+            <link type="boardgamecategory" id="1" value="Economic"/>
+            <link type="boardgamedesigner" id="2" value="Karl-Heinz Schmiel"/>
+            <link type="boardgamecategory" id="3" value="Negotiation"/>
+        </item>
+    </items>
+    """
+    item = ThingSchema.parse_xml(xml).items[0]
+    assert item.name == "Die Macher"
+    assert item.description == "Election game."
+    assert item.categories == ["Economic", "Negotiation"]
+    assert item.designers == ["Karl-Heinz Schmiel"]
+    assert item.mechanics == []
+
+
+def test_parse_thing_xml_main_rank():
+    """Test that the main boardgame rank (id=1) is picked from the ranks list."""
+    xml = """
+    <items>
+        <item type="boardgame" id="1">
+            <statistics>
+                <ratings usersrated="5000" average="7.6">
+                    <ranks>
+                        <rank type="family" id="5497" value="12"/>
+                        <rank type="subtype" id="1" value="321"/>
+                    </ranks>
+                </ratings>
+            </statistics>
+        </item>
+        <item type="boardgame" id="2">
+            <statistics>
+                <ratings><ranks><rank type="subtype" id="1" value="Not Ranked"/></ranks></ratings>
+            </statistics>
+        </item>
+    </items>
+    """
+    items = ThingSchema.parse_xml(xml).items
+    assert items[0].rank == 321
+    assert items[1].rank is None
+
+
+def test_parse_xml_accepts_bytes():
+    """Test that raw response bytes with an encoding declaration parse like text."""
+    xml = '<?xml version="1.0" encoding="utf-8"?><items><item id="7"><name value="Café"/></item></items>'
+    assert ThingSchema.parse_xml(xml.encode("utf-8")) == ThingSchema.parse_xml(xml)
+    assert ThingSchema.parse_xml(xml.encode("utf-8")).items[0].name == "Café"
+
+
+def test_parse_family_xml():
+    """Test parsing family XML with several items."""
+    xml = """<items>
+        <item type="boardgamefamily" id="1"><name type="primary" value="Catan"/><description>Isles</description></item>
+        <item type="boardgamefamily" id="2"><name type="primary" value="Brass"/></item>
+    </items>"""
+    result = FamilySchema.parse_xml(xml)
+    assert [(i.id, i.name, i.description) for i in result.items] == [(1, "Catan", "Isles"), (2, "Brass", None)]
+
+
+def test_parse_xml_stream_yields_items_from_file_object():
+    """Test that parse_xml_stream reads a binary stream lazily and matches parse_xml."""
+
+    xml = b"""<?xml version="1.0" encoding="utf-8"?>
+    <plays username="u" total="2" page="1">
+        <play id="1" date="2024-01-01" quantity="1"><item name="Catan" objectid="13"/></play>
+        <play id="2" date="2024-01-02" quantity="2"><item name="Brass" objectid="224517"/></play>
+    </plays>"""
+    stream = PlaysSchema.parse_xml_stream(io.BytesIO(xml))
+    first = next(stream)
+    assert first.id == 1
+    assert [first, *stream] == PlaysSchema.parse_xml(xml).plays
+
+
+def test_parse_collection_xml_full_item():
+    """Test a collection item with nested rating, status and comment children."""
+    xml = """
+    <items>
+        <item objectid="13" subtype="boardgame" collid="99">
+            <name sortindex="1">Catan</name>
+            <stats minplayers="3"><rating value="7.5"/></stats>
+            <status own="1" wishlist="0"/>
+            <comment>Classic</comment>
+        </item>
+    </items>
+    """
+    item = CollectionSchema.parse_xml(xml).items[0]
+    assert (item.name, item.rating, item.comment) == ("Catan", 7.5, "Classic")
+    assert item.status == {"own": "1", "wishlist": "0"}
+
+
+def test_parse_plays_xml_players():
+    """Test that each <player> under <players> is copied into a plain dict."""
+    xml = b"""<plays><play id="1" date="2024-01-01" quantity="1">
+        <players><player username="a" score="10" win="1"/><player username="b" score="7" win="0"/></players>
+    </play></plays>"""
+    play = PlaysSchema.parse_xml(xml).plays[0]
+    assert [p["username"] for p in play.players] == ["a", "b"]
+    assert play.players[0] == {"username": "a", "score": "10", "win": "1"}
+
+
+def test_play_sub_item_dict_compatibility():
+    """Test that PlaySubItem validates from a dict and supports item["field"] lookups."""
+
+    play = PlayItem(id=1, item={"name": "Catan", "objectid": "13"})
+    assert play.item["objectid"] == play.item.objectid == 13
+    with pytest.raises(KeyError):
+        play.item["missing"]
+
+
+def test_parse_xml_file_matches_parse_xml():
+    """Test that parsing a saved response from disk matches parsing its bytes."""
+    path = FIXTURES / "thing_die_macher.xml"
+    assert ThingSchema.parse_xml_file(path) == ThingSchema.parse_xml(path.read_bytes())
+    assert ThingSchema.parse_xml_file(str(path)).items[0].name == "Die Macher"
@@ -1,5 +1,9 @@
+from pathlib import Path
+
 from bgg_extractor.schemas import SearchQuery, SearchSchema
 
+FIXTURES = Path(__file__).parent / "fixtures"
+
 
 def test_search_query_basic():
     """Test basic SearchQuery creation."""
@@ -42,19 +46,7 @@ def test_search_query_from_types():
 
 def test_search_schema_parse_xml():
     """Test parsing of Search XML."""
-    xml = """
-    <items total="2">
-        <item type="boardgame" id="13">
-            <name type="primary" value="Catan"/>
-            <yearpublished value="1995"/>
-        </item>
-        <item type="boardgameexpansion" id="14">
-            <name type="primary" value="Catan: Seafarers"/>
-            <yearpublished value="1997"/>
-        </item>
-    </items>
-    """
-    schema = SearchSchema.parse_xml(xml)
+    schema = SearchSchema.parse_xml_file(FIXTURES / "search_catan.xml")
     assert len(schema.items) == 2
 
     item1 = schema.items[0]
@@ -68,3 +60,30 @@ def test_search_schema_parse_xml():
     assert item2.type == "boardgameexpansion"
     assert item2.name == "Catan: Seafarers"
     assert item2.yearpublished == 1997
+
+
+def test_search_query_escapes_reserved_characters():
+    """Test that the query string percent-encodes reserved characters."""
+    s = SearchQuery.from_query("dungeons & dragons")
+    assert s.search_string == "search?query=dungeons+%26+dragons&exact=1"
+    assert SearchQuery(query="Twilight: Imperium").search_string == "search?query=Twilight%3A+Imperium&exact=1"
+    assert SearchQuery(query="Café").search_string == "search?query=Caf%C3%A9&exact=1"
+
+
+def test_search_query_encodes_spaces_as_plus():
+    """Test that spaces in a query built directly are sent as '+'."""
+    s = SearchQuery(query="Die Macher")
+    assert s.search_string == "search?query=Die+Macher&exact=1"
+
+
+def test_search_query_copy_rebuilds_search_string():
+    """Test that model_copy with updated fields yields a matching query string."""
+    s = SearchQuery(query="catan").model_copy(update={"query": "carcassonne", "exact": False})
+    assert s.search_string == "search?query=carcassonne"
+
+
+def test_search_query_is_mutable():
+    """Test that fields can be reassigned and search_string follows them."""
+    s = SearchQuery(query="catan")
+    s.exact = False
+    assert s.search_string == "search?query=catan"
@@ -1,8 +1,11 @@
 """Tests for synchronous client wrappers."""
 
 import pytest
+import respx
+from httpx import Response
 
 from bgg_extractor import (
+    BGGClient,
     get_collection,
     get_family,
     get_plays,
@@ -52,3 +55,20 @@ def test_get_user_requires_token(monkeypatch):
     monkeypatch.delenv("BGG_API_TOKEN", raising=False)
     with pytest.raises(ValueError, match="BGG_API_TOKEN is required"):
         get_user("user")
+
+
+def test_sync_wrappers_reuse_shared_client(monkeypatch):
+    """Test that consecutive sync calls reuse the same pooled HTTP client."""
+    client = BGGClient.default()
+    monkeypatch.setattr(client, "min_delay", 0.0)
+    with respx.mock:
+        route = respx.get(url__startswith="https://api.geekdo.com/xmlapi2/search").mock(
+            return_value=Response(200, text="<items/>")
+        )
+        search("catan")
+        search("catan")
+        assert route.call_count == 2
+
+    assert BGGClient.default() is client
+    assert client._client is not None
+    assert not client._client.is_closed
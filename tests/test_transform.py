@@ -1,7 +1,7 @@
 """Tests for transform module."""
 
 from bgg_extractor.schemas import ThingItem, UserSchema
-from bgg_extractor.transform import model_to_dict, models_to_list
+from bgg_extractor.transform import model_to_dict, models_to_arrow, models_to_json, models_to_list
 
 
 def test_model_to_dict():
@@ -24,3 +24,47 @@ def test_models_to_list():
     assert len(result) == 2
     assert result[0]["id"] == 1
     assert result[1]["name"] == "Game2"
+
+
+def test_models_to_list_matches_model_dump():
+    """Test that batch and mixed-type conversions match per-model model_dump()."""
+    items = [ThingItem(id=1, name="Game1"), ThingItem(id=2, name="Game2")]
+    mixed = [*items, UserSchema(id=3, name="u")]
+    assert models_to_list(items) == [m.model_dump() for m in items]
+    assert models_to_list(tuple(items)) == [m.model_dump() for m in items]
+    assert models_to_list(mixed) == [m.model_dump() for m in mixed]
+    assert models_to_list([]) == []
+
+
+def test_models_to_arrow():
+    """Test converting models straight to an Arrow table."""
+    items = [ThingItem(id=1, name="Game1"), ThingItem(id=2, name="Game2", yearpublished=2020)]
+    table = models_to_arrow(items)
+    assert table.num_rows == 2
+    assert table.column("id").to_pylist() == [1, 2]
+    assert table.column("yearpublished").to_pylist() == [None, 2020]
+
+
+def test_models_to_list_accepts_iterables():
+    """Test converting a generator of models, e.g. from parse_xml_stream."""
+    items = [ThingItem(id=1, name="Game1"), ThingItem(id=2, name="Game2")]
+    assert models_to_list(m for m in items) == [m.model_dump() for m in items]
+
+
+def test_model_to_dict_fast_matches_for_flat_models():
+    """Test that the fast path matches model_dump() for flat models."""
+    user = UserSchema(id=123, name="testuser")
+    item = ThingItem(id=1, name="Game1", categories=["Economic"])
+    assert model_to_dict(user, fast=True) == model_to_dict(user)
+    assert model_to_dict(item, fast=True) == model_to_dict(item)
+
+
+def test_models_to_json():
+    """Test direct JSON serialization of homogeneous and mixed model lists."""
+    import json
+
+    items = [ThingItem(id=1, name="Game1"), ThingItem(id=2, name="Game2")]
+    mixed = [*items, UserSchema(id=3, name="u")]
+    assert json.loads(models_to_json(items)) == [m.model_dump(mode="json") for m in items]
+    assert json.loads(models_to_json(iter(mixed), indent=2)) == [m.model_dump(mode="json") for m in mixed]
+    assert models_to_json([]) == b"[]"